@@ -5,9 +5,18 @@ Creates background music tracks for the game
 
 import mido
 import os
+import sys
 
-def create_background_music():
+def _is_cached(path):
+    """Check whether a track has already been generated"""
+    return os.path.exists(path) and os.path.getsize(path) > 0
+
+def create_background_music(force=False):
     """Create a simple ambient background MIDI track"""
+    path = 'music/background_ambient.mid'
+    if not force and _is_cached(path):
+        return
+    
     # Create a new MIDI file
     mid = mido.MidiFile()
     track = mido.MidiTrack()
@@ -32,29 +41,34 @@ def create_background_music():
     # Vary the rhythm - some chords held longer
     chord_durations = [960, 480, 960, 480, 720, 480, 720, 960]  # Different lengths
     
+    # Arpeggio delay accumulated across each (three-note) chord
+    arp_offset = sum(range(len(chords[0]))) * 20
+    
     # Play the progression several times with variations
+    msgs = []
     for cycle in range(6):  # 6 cycles for more variation
         for i, (chord, duration) in enumerate(zip(chords, chord_durations)):
             # Add some bass notes occasionally
-            if cycle > 2 and i % 2 == 0:  # Add bass on cycles 3+ every other chord
-                bass_note = chord[0] - 12  # Octave lower
-                track.append(mido.Message('note_on', channel=0, note=bass_note, velocity=30, time=0))
+            has_bass = cycle > 2 and i % 2 == 0  # Add bass on cycles 3+ every other chord
+            bass_note = chord[0] - 12  # Octave lower
+            if has_bass:
+                msgs.append(mido.Message('note_on', channel=0, note=bass_note, velocity=30, time=0))
             
-            # Play chord notes with slight timing variation
-            for j, note in enumerate(chord):
-                delay = j * 20 if cycle > 1 else 0  # Slight arpeggio effect after first cycle
-                track.append(mido.Message('note_on', channel=0, note=note, velocity=40 + cycle * 2, time=delay))
+            # Play chord notes with slight timing variation (arpeggio effect after first cycle)
+            msgs.extend([mido.Message('note_on', channel=0, note=note, velocity=40 + cycle * 2,
+                                      time=j * 20 if cycle > 1 else 0)
+                         for j, note in enumerate(chord)])
             
             # Hold the chord
-            track.append(mido.Message('note_off', channel=0, note=chord[0], velocity=0, time=duration - sum(range(len(chord))) * 20))
+            msgs.append(mido.Message('note_off', channel=0, note=chord[0], velocity=0, time=duration - arp_offset))
             
             # Release other notes
-            for note in chord[1:]:
-                track.append(mido.Message('note_off', channel=0, note=note, velocity=0, time=0))
+            msgs.extend([mido.Message('note_off', channel=0, note=note, velocity=0, time=0) for note in chord[1:]])
             
             # Release bass note if present
-            if cycle > 2 and i % 2 == 0:
-                track.append(mido.Message('note_off', channel=0, note=bass_note, velocity=0, time=0))
+            if has_bass:
+                msgs.append(mido.Message('note_off', channel=0, note=bass_note, velocity=0, time=0))
+    track.extend(msgs)
     
     # Add a more elaborate melody line
     melody_track = mido.MidiTrack()
@@ -71,20 +85,28 @@ def create_background_music():
         [60, 62, 64, 67, 69, 67, 64, 60],  # Lower octave
     ]
     
-    for cycle, pattern in enumerate(melody_patterns):
-        for i, note in enumerate(pattern):
-            velocity = 35 + (i % 3) * 5  # Dynamic accents
-            note_duration = 480 if i % 2 == 0 else 360  # Rhythm variation
-            melody_track.append(mido.Message('note_on', channel=1, note=note, velocity=velocity, time=0))
-            melody_track.append(mido.Message('note_off', channel=1, note=note, velocity=0, time=note_duration))
+    melody_track.extend([
+        msg
+        for pattern in melody_patterns
+        for i, note in enumerate(pattern)
+        for msg in (
+            # Dynamic accents and rhythm variation
+            mido.Message('note_on', channel=1, note=note, velocity=35 + (i % 3) * 5, time=0),
+            mido.Message('note_off', channel=1, note=note, velocity=0, time=480 if i % 2 == 0 else 360),
+        )
+    ])
     
     # Save the MIDI file
     os.makedirs('music', exist_ok=True)
-    mid.save('music/background_ambient.mid')
+    mid.save(path)
     print("Created enhanced background_ambient.mid")
 
-def create_upbeat_music():
+def create_upbeat_music(force=False):
     """Create a more upbeat track for action sequences"""
+    path = 'music/background_upbeat.mid'
+    if not force and _is_cached(path):
+        return
+    
     mid = mido.MidiFile()
     track = mido.MidiTrack()
     mid.tracks.append(track)
@@ -106,39 +128,42 @@ def create_upbeat_music():
     
     ticks_per_chord = 240  # Even faster tempo
     
+    msgs = []
     for cycle in range(8):
         for i, chord in enumerate(chords):
             # Add driving rhythm with accents
             accent = 80 if i % 4 == 0 else 60
-            for note in chord:
-                track.append(mido.Message('note_on', channel=0, note=note, velocity=accent, time=0))
+            msgs.extend([mido.Message('note_on', channel=0, note=note, velocity=accent, time=0) for note in chord])
             
             # Shorter note durations for driving feel
-            track.append(mido.Message('note_off', channel=0, note=chord[0], velocity=0, time=ticks_per_chord))
+            msgs.append(mido.Message('note_off', channel=0, note=chord[0], velocity=0, time=ticks_per_chord))
             
-            for note in chord[1:]:
-                track.append(mido.Message('note_off', channel=0, note=note, velocity=0, time=0))
+            msgs.extend([mido.Message('note_off', channel=0, note=note, velocity=0, time=0) for note in chord[1:]])
+    track.extend(msgs)
     
     # Add percussion-like track
     drums_track = mido.MidiTrack()
     mid.tracks.append(drums_track)
     drums_track.append(mido.Message('program_change', program=116, time=0))  # Synth drum
     
-    # Simple drum pattern
-    for cycle in range(32):  # More repetitions for driving rhythm
-        # Kick on 1 and 3
-        drums_track.append(mido.Message('note_on', channel=9, note=36, velocity=100, time=0))
-        drums_track.append(mido.Message('note_off', channel=9, note=36, velocity=0, time=240))
-        
-        # Snare on 2 and 4
-        drums_track.append(mido.Message('note_on', channel=9, note=38, velocity=80, time=0))
-        drums_track.append(mido.Message('note_off', channel=9, note=38, velocity=0, time=240))
-    
-    mid.save('music/background_upbeat.mid')
+    # Simple drum pattern: kick on 1 and 3, snare on 2 and 4
+    drum_bar = [
+        mido.Message('note_on', channel=9, note=36, velocity=100, time=0),
+        mido.Message('note_off', channel=9, note=36, velocity=0, time=240),
+        mido.Message('note_on', channel=9, note=38, velocity=80, time=0),
+        mido.Message('note_off', channel=9, note=38, velocity=0, time=240),
+    ]
+    drums_track.extend(drum_bar * 32)  # More repetitions for driving rhythm
+    
+    mid.save(path)
     print("Created enhanced background_upbeat.mid")
 
-def create_exploration_music():
+def create_exploration_music(force=False):
     """Create a mysterious exploration track"""
+    path = 'music/background_exploration.mid'
+    if not force and _is_cached(path):
+        return
+    
     mid = mido.MidiFile()
     track = mido.MidiTrack()
     mid.tracks.append(track)
@@ -161,16 +186,16 @@ def create_exploration_music():
     # Slower, more mysterious timing
     ticks_per_chord = 1440  # Longer, more atmospheric
     
+    msgs = []
     for cycle in range(4):
         for chord in chords:
             # Soft, mysterious volume
-            for note in chord:
-                track.append(mido.Message('note_on', channel=0, note=note, velocity=25 + cycle * 5, time=0))
+            msgs.extend([mido.Message('note_on', channel=0, note=note, velocity=25 + cycle * 5, time=0) for note in chord])
             
-            track.append(mido.Message('note_off', channel=0, note=chord[0], velocity=0, time=ticks_per_chord))
+            msgs.append(mido.Message('note_off', channel=0, note=chord[0], velocity=0, time=ticks_per_chord))
             
-            for note in chord[1:]:
-                track.append(mido.Message('note_off', channel=0, note=note, velocity=0, time=0))
+            msgs.extend([mido.Message('note_off', channel=0, note=note, velocity=0, time=0) for note in chord[1:]])
+    track.extend(msgs)
     
     # Add eerie melody
     melody_track = mido.MidiTrack()
@@ -180,17 +205,23 @@ def create_exploration_music():
     # Eerie melody pattern
     melody_notes = [69, 67, 64, 62, 60, 62, 64, 67, 69, 72, 69, 67, 64, 60, 57, 60]
     
-    for cycle in range(2):
-        for i, note in enumerate(melody_notes):
-            velocity = 30 + (i % 5) * 3
-            melody_track.append(mido.Message('note_on', channel=1, note=note, velocity=velocity, time=0))
-            melody_track.append(mido.Message('note_off', channel=1, note=note, velocity=0, time=720))
+    melody_bar = [
+        msg
+        for i, note in enumerate(melody_notes)
+        for msg in (
+            mido.Message('note_on', channel=1, note=note, velocity=30 + (i % 5) * 3, time=0),
+            mido.Message('note_off', channel=1, note=note, velocity=0, time=720),
+        )
+    ]
+    melody_track.extend(melody_bar * 2)
     
-    mid.save('music/background_exploration.mid')
+    mid.save(path)
     print("Created background_exploration.mid")
 
 if __name__ == "__main__":
-    create_background_music()
-    create_upbeat_music()
-    create_exploration_music()
+    # Existing tracks are kept unless --force is given
+    force = "--force" in sys.argv
+    create_background_music(force)
+    create_upbeat_music(force)
+    create_exploration_music(force)
     print("Enhanced MIDI files created successfully!")
\ No newline at end of file
@@ -5,17 +5,52 @@ A 2D game where worms dig through terrain using various tools
 
 import pygame
 import sys
+import gc
+import time
 from src.game import Game
 from src.menu import GameMenu
 from src.music import MusicSystem
+from src.dynamite import ThrownDynamite
 from src.endgame_stats import show_endgame_stats
-from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, MAX_FRAME_DT, GC_FRAME_BUDGET
+
+# Duration (seconds) of the last full collection, used to tell whether one fits the budget
+_full_collect_s = 0.0
+
+def collect_garbage(budget_s):
+    """Run the GC generations that are due, youngest first, within a time budget"""
+    global _full_collect_s
+    start = time.perf_counter()
+    thresholds = gc.get_threshold()
+    for generation in range(3):
+        if gc.get_count()[generation] < thresholds[generation]:
+            break
+        if generation == 2:
+            # Only start a full collection when the last one would fit in what is left of the
+            # budget; each skip lowers the estimate a little so it still runs now and then
+            if time.perf_counter() - start + _full_collect_s > budget_s:
+                _full_collect_s *= 0.99
+                break
+            full_start = time.perf_counter()
+            gc.collect(2)
+            _full_collect_s = time.perf_counter() - full_start
+            break
+        gc.collect(generation)
+        if time.perf_counter() - start >= budget_s:
+            break  # Older generations wait for the next frame
 
 def main():
     """Main game loop"""
     pygame.init()
     pygame.mixer.init()  # Initialize audio mixer
     
+    # Only queue the event types the game actually handles
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP,
+                              pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION,
+                              pygame.WINDOWFOCUSLOST, pygame.WINDOWFOCUSGAINED])
+    ThrownDynamite.preload()  # Build shared explosion sound once
+    
     # Create the game window
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("Vibe Bugs")
@@ -32,29 +67,43 @@ def main():
     menu = GameMenu(screen)
     game = None
     
+    # Bind per-frame pygame lookups to locals for the hot loop
+    event_get = pygame.event.get
+    flip = pygame.display.flip
+    tick = clock.tick
+    QUIT = pygame.QUIT
+    
     # Main game loop
     running = True
     while running:
-        # Handle events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        # Handle events (drained as one batch per frame)
+        events = event_get()
+        for event in events:
+            if event.type == QUIT:
                 running = False
-            elif game_state == "menu":
+        
+        if game_state == "menu":
+            for i, event in enumerate(events):
                 result = menu.handle_event(event)
                 if result == "start_game":
                     # Start the game with menu configuration
                     config = menu.get_game_config()
                     game = Game(screen, config)
                     game_state = "playing"
-            elif game_state == "playing":
-                result = game.handle_event(event)
-                if result == "quit_to_menu":
-                    # Return to menu
-                    game_state = "menu"
-                    game = None
+                    gc.disable()  # Collect between frames during gameplay (see collect_garbage)
+                    events = events[i + 1:]  # The rest of the batch goes to the new game
+                    break
+        if game_state == "playing":
+            result = game.handle_events(events)
+            if result == "quit_to_menu":
+                # Return to menu
+                game_state = "menu"
+                game = None
+                gc.enable()
         
         # Update game state
-        dt = clock.tick(FPS) / 1000.0  # Delta time in seconds
+        real_dt = tick(FPS) / 1000.0  # Delta time in seconds
+        dt = min(real_dt, MAX_FRAME_DT)  # Capped after hitches for variable-step updates
         
         # Update music system
         music_system.update(dt)
@@ -62,9 +111,10 @@ def main():
         if game_state == "menu":
             menu.update(dt)
         elif game_state == "playing":
-            result = game.update(dt)
+            result = game.step(real_dt)  # Game catches up in fixed steps
             if result == "show_endgame_stats":
-                # Show end game statistics screen
+                # Show end game statistics screen (its own loop, so automatic GC is back on)
+                gc.enable()
                 game_stats = game.get_game_stats()
                 continue_to_menu = show_endgame_stats(screen, game_stats)
                 if continue_to_menu:
@@ -79,7 +129,9 @@ def main():
         elif game_state == "playing":
             game.render()
             
-        pygame.display.flip()
+        flip()
+        if game_state == "playing":
+            collect_garbage(GC_FRAME_BUDGET)
     
     pygame.quit()
     sys.exit()
@@ -2,6 +2,10 @@
 SCREEN_WIDTH = 1920
 SCREEN_HEIGHT = 1080
 FPS = 60
+MAX_FRAME_DT = 1 / 30  # Clamp frame delta (seconds) so stalls don't cause huge physics steps
+FIXED_DT = 1 / FPS  # Simulation step (seconds), independent of the render rate
+MAX_STEPS_PER_FRAME = 5  # Drop simulation time beyond this many steps per frame
+GC_FRAME_BUDGET = 0.001  # Seconds of garbage collection allowed between frames
 
 # Colors (RGB)
 BLACK = (0, 0, 0)
@@ -4,17 +4,49 @@ Dynamite class for thrown explosives with timers
 
 import pygame
 import math
-import time
-import random
-from src.config import *
+import numpy as np
+from src.config import DYNAMITE_FUSE_TIME, SCREEN_WIDTH, SCREEN_HEIGHT, RED, YELLOW, WHITE
+
+_TWO_PI = 2.0 * math.pi
 
 class ThrownDynamite:
     # Class variable for explosion sound (shared by all instances)
     explosion_sound = None
     
+    # Pre-rendered sprites for both blink states (shared by all instances)
+    sprite_on = None
+    sprite_off = None
+    SPRITE_OFFSET = (-4, -5)  # Sprite top-left relative to the dynamite position
+    
+    @classmethod
+    def _build_sprites(cls):
+        """Pre-render the dynamite stick in its lit and unlit blink states"""
+        for blink_phase in (True, False):
+            sprite = pygame.Surface((16, 8), pygame.SRCALPHA)
+            dynamite_color = RED if blink_phase else (150, 0, 0)
+            fuse_color = YELLOW if blink_phase else (200, 200, 0)
+            
+            # Dynamite body
+            pygame.draw.rect(sprite, dynamite_color, (0, 3, 8, 4))
+            
+            # Fuse
+            pygame.draw.circle(sprite, fuse_color, (8, 2), 2)
+            
+            # Sparks on fuse
+            if blink_phase:
+                for i in range(3):
+                    pygame.draw.circle(sprite, WHITE, (8 + i * 2, 2), 1)
+            
+            if blink_phase:
+                cls.sprite_on = sprite
+            else:
+                cls.sprite_off = sprite
+    
     @classmethod
-    def _create_explosion_sound(cls):
-        """Create a deep explosion sound effect"""
+    def preload(cls):
+        """Create the shared sprites and deep explosion sound effect (call once after mixer init)"""
+        if cls.sprite_on is None:
+            cls._build_sprites()
         if cls.explosion_sound is None:
             try:
                 # Create a deep explosion sound using random noise and low frequencies
@@ -23,34 +55,29 @@ class ThrownDynamite:
                 samples = int(sample_rate * duration)
                 
                 # Generate explosion sound data with deeper frequencies
-                sound_data = []
-                for i in range(samples):
-                    t = i / sample_rate
-                    
-                    # Create noise with decreasing amplitude (exponential decay)
-                    amplitude = max(0, 1.0 - (i / samples)) ** 1.5  # Less steep decay for longer rumble
-                    
-                    # Add low-frequency rumble component
-                    rumble_freq = 40 + (1.0 - t/duration) * 60  # 40-100 Hz decreasing
-                    rumble = math.sin(2 * math.pi * rumble_freq * t) * 0.4 * amplitude
-                    
-                    # Add mid-frequency boom
-                    boom_freq = 80 + (1.0 - t/duration) * 120  # 80-200 Hz decreasing
-                    boom = math.sin(2 * math.pi * boom_freq * t) * 0.3 * amplitude
-                    
-                    # High-frequency noise for impact
-                    noise = random.uniform(-1, 1) * amplitude * 0.2
-                    
-                    # Combine all components
-                    combined = (rumble + boom + noise) * 0.4  # Lower overall volume
-                    
-                    # Convert to 16-bit integer
-                    sample = int(combined * 32767)
-                    sample = max(-32768, min(32767, sample))  # Clamp
-                    sound_data.extend([sample, sample])  # Stereo
+                i = np.arange(samples)
+                t = i / sample_rate
+                
+                # Create noise with decreasing amplitude (exponential decay)
+                amplitude = np.maximum(0, 1.0 - (i / samples)) ** 1.5  # Less steep decay for longer rumble
+                
+                # Add low-frequency rumble component
+                rumble_freq = 40 + (1.0 - t/duration) * 60  # 40-100 Hz decreasing
+                rumble = np.sin(_TWO_PI * rumble_freq * t) * 0.4 * amplitude
+                
+                # Add mid-frequency boom
+                boom_freq = 80 + (1.0 - t/duration) * 120  # 80-200 Hz decreasing
+                boom = np.sin(_TWO_PI * boom_freq * t) * 0.3 * amplitude
                 
-                # Convert to bytes
-                sound_bytes = b''.join(sample.to_bytes(2, 'little', signed=True) for sample in sound_data)
+                # High-frequency noise for impact
+                noise = np.random.uniform(-1, 1, samples) * amplitude * 0.2
+                
+                # Combine all components
+                combined = (rumble + boom + noise) * 0.4  # Lower overall volume
+                
+                # Convert to 16-bit integers, duplicated for stereo
+                sound_data = np.clip(combined * 32767, -32768, 32767).astype('<i2')
+                sound_bytes = np.repeat(sound_data, 2).tobytes()
                 
                 # Create pygame sound object
                 cls.explosion_sound = pygame.mixer.Sound(buffer=sound_bytes)
@@ -59,17 +86,14 @@ class ThrownDynamite:
                 # Create a silent sound as fallback
                 cls.explosion_sound = None
     
-    def __init__(self, x, y, target_x, target_y, power):
+    def __init__(self, x, y, target_x, target_y, power, pool):
         self.start_x = float(x)
         self.start_y = float(y)
-        self.x = float(x)
-        self.y = float(y)
-        self.start_time = time.time()
         
         # Calculate direction and velocity based on target and power
         dx = target_x - x
         dy = target_y - y
-        distance = math.sqrt(dx*dx + dy*dy)
+        distance = math.hypot(dx, dy)
         
         if distance > 0:
             # Normalize direction
@@ -85,63 +109,53 @@ class ThrownDynamite:
         velocity = base_speed * speed_multiplier
         
         # Set velocity components
-        self.vel_x = direction_x * velocity
-        self.vel_y = direction_y * velocity - 75  # Increased upward bias for higher arc
+        vel_x = direction_x * velocity
+        vel_y = direction_y * velocity - 75  # Increased upward bias for higher arc
         
-        # Physics properties
-        self.gravity = GRAVITY  # Use game gravity
+        # Physics state lives in the shared pool while the fuse burns
+        self.pool = pool
+        self.slot = pool.add(self, self.start_x, self.start_y, vel_x, vel_y)
+        self.final_position = None
         self.has_exploded = False
         self.exploded_this_frame = False  # Flag for damage checking
         
-    def update(self, dt, terrain=None):
-        """Update dynamite position and check for explosion"""
-        current_time = time.time()
-        elapsed = current_time - self.start_time
+    @property
+    def x(self):
+        if self.slot is None:
+            return self.final_position[0]
+        return float(self.pool.xs[self.slot])
+    
+    @property
+    def y(self):
+        if self.slot is None:
+            return self.final_position[1]
+        return float(self.pool.ys[self.slot])
+    
+    @property
+    def elapsed(self):
+        """Fuse time burned so far"""
+        if self.slot is None:
+            return DYNAMITE_FUSE_TIME
+        return float(self.pool.elapsed[self.slot])
         
-        # Physics-based movement
-        if not self.has_exploded and elapsed < DYNAMITE_FUSE_TIME:
-            # Store old position for collision detection
-            old_x = self.x
-            old_y = self.y
-            
-            # Update position with velocity
-            new_x = self.x + self.vel_x * dt
-            new_y = self.y + self.vel_y * dt
-            
-            # Check for terrain collision if terrain is provided
-            if terrain and terrain.is_solid(new_x, new_y):
-                # Hit the ground - stop movement
-                self.vel_x = 0
-                self.vel_y = 0
-                # Don't update position, keep it at the last valid position
-            else:
-                # No collision, update position normally
-                self.x = new_x
-                self.y = new_y
-                
-                # Apply gravity to Y velocity
-                self.vel_y += self.gravity * dt
-            
-        # Check for explosion (timer-based)
-        if elapsed >= DYNAMITE_FUSE_TIME and not self.has_exploded:
-            self.has_exploded = True
-            self.exploded_this_frame = True  # Set flag for damage checking
-            # Create and play explosion sound
-            self._create_explosion_sound()
-            if self.explosion_sound:
-                self.explosion_sound.play()
-            return True  # Signal explosion
-            
-        return False
+    def explode(self, x, y):
+        """Called by the pool when the fuse runs out"""
+        self.slot = None
+        self.final_position = (x, y)
+        self.has_exploded = True
+        self.exploded_this_frame = True  # Set flag for damage checking
+        # Play the preloaded explosion sound
+        sound = ThrownDynamite.explosion_sound
+        if sound:
+            sound.play()
         
     def get_position(self):
         """Get current position"""
         return (self.x, self.y)
         
-    def render(self, screen, camera_x=0, camera_y=0):
-        """Render the dynamite"""
-        current_time = time.time()
-        elapsed = current_time - self.start_time
+    def get_blit(self, camera_x=0, camera_y=0):
+        """Get the (sprite, position) pair to draw this dynamite, or None if off screen"""
+        elapsed = self.elapsed
         
         # Convert to screen coordinates
         screen_x = self.x - camera_x
@@ -151,22 +165,10 @@ class ThrownDynamite:
         if -20 <= screen_x <= SCREEN_WIDTH + 20 and -20 <= screen_y <= SCREEN_HEIGHT + 20:
             # Blink faster as explosion approaches
             blink_rate = 2 + (elapsed / DYNAMITE_FUSE_TIME) * 8
-            blink_phase = math.sin(elapsed * blink_rate * math.pi) > 0
+            # Lit on even half-periods, same as sin(elapsed * blink_rate * pi) > 0
+            blink_phase = (int(elapsed * blink_rate) & 1) == 0
             
-            # Draw dynamite stick
-            dynamite_color = RED if blink_phase else (150, 0, 0)
-            fuse_color = YELLOW if blink_phase else (200, 200, 0)
-            
-            # Dynamite body
-            pygame.draw.rect(screen, dynamite_color, 
-                            (int(screen_x - 4), int(screen_y - 2), 8, 4))
-            
-            # Fuse
-            pygame.draw.circle(screen, fuse_color, (int(screen_x + 4), int(screen_y - 3)), 2)
-            
-            # Sparks on fuse
-            if blink_phase:
-                for i in range(3):
-                    spark_x = int(screen_x + 4 + i * 2)
-                    spark_y = int(screen_y - 3)
-                    pygame.draw.circle(screen, WHITE, (spark_x, spark_y), 1)
\ No newline at end of file
+            sprite = ThrownDynamite.sprite_on if blink_phase else ThrownDynamite.sprite_off
+            offset_x, offset_y = ThrownDynamite.SPRITE_OFFSET
+            return sprite, (int(screen_x) + offset_x, int(screen_y) + offset_y)
+        return None
@@ -0,0 +1,106 @@
+"""
+Dynamite Pool
+Steps every in-flight thrown dynamite at once using parallel NumPy arrays
+"""
+
+import numpy as np
+from src.config import GRAVITY, DYNAMITE_FUSE_TIME
+
+class DynamitePool:
+    def __init__(self, capacity=32):
+        # Parallel state arrays (one slot per live dynamite)
+        self.xs = np.zeros(capacity)
+        self.ys = np.zeros(capacity)
+        self.vxs = np.zeros(capacity)
+        self.vys = np.zeros(capacity)
+        self.elapsed = np.zeros(capacity)
+        self.live = 0
+        
+        # ThrownDynamite handle for each live slot
+        self.handles = []
+    
+    def _grow(self):
+        """Double the capacity of all state arrays"""
+        capacity = len(self.xs) * 2
+        for name in ('xs', 'ys', 'vxs', 'vys', 'elapsed'):
+            grown = np.zeros(capacity)
+            grown[:self.live] = getattr(self, name)[:self.live]
+            setattr(self, name, grown)
+    
+    def add(self, dynamite, x, y, vel_x, vel_y):
+        """Register a dynamite and return its slot index"""
+        if self.live == len(self.xs):
+            self._grow()
+        
+        slot = self.live
+        self.xs[slot] = x
+        self.ys[slot] = y
+        self.vxs[slot] = vel_x
+        self.vys[slot] = vel_y
+        self.elapsed[slot] = 0.0
+        self.handles.append(dynamite)
+        self.live += 1
+        return slot
+    
+    def clear(self):
+        """Drop every live dynamite (e.g. when the level is regenerated)"""
+        for slot, dynamite in enumerate(self.handles):
+            dynamite.final_position = (float(self.xs[slot]), float(self.ys[slot]))
+            dynamite.slot = None
+        self.handles = []
+        self.live = 0
+    
+    def step(self, dt, terrain):
+        """Advance all live dynamites and return the ones that exploded this frame"""
+        live = self.live
+        if live == 0:
+            return []
+        
+        xs = self.xs[:live]
+        ys = self.ys[:live]
+        vxs = self.vxs[:live]
+        vys = self.vys[:live]
+        elapsed = self.elapsed[:live]
+        
+        elapsed += dt
+        
+        # Only dynamites whose fuse is still burning move this frame
+        moving = elapsed < DYNAMITE_FUSE_TIME
+        new_x = xs + vxs * dt
+        new_y = ys + vys * dt
+        solid = terrain.is_solid_batch(new_x, new_y)
+        
+        # Hit the ground - stop movement and keep the last valid position
+        landed = moving & solid
+        vxs[landed] = 0
+        vys[landed] = 0
+        
+        # No collision - commit position and apply gravity
+        flying = moving & ~solid
+        xs[flying] = new_x[flying]
+        ys[flying] = new_y[flying]
+        vys[flying] += GRAVITY * dt
+        
+        # Check for explosions (timer-based)
+        exploded_mask = ~moving
+        if not exploded_mask.any():
+            return []
+        
+        exploded = []
+        for slot in np.flatnonzero(exploded_mask):
+            dynamite = self.handles[slot]
+            dynamite.explode(float(xs[slot]), float(ys[slot]))
+            exploded.append(dynamite)
+        
+        # Compact the remaining dynamites to the front of the arrays
+        keep = ~exploded_mask
+        remaining = int(keep.sum())
+        for name in ('xs', 'ys', 'vxs', 'vys', 'elapsed'):
+            array = getattr(self, name)
+            array[:remaining] = array[:live][keep]
+        self.handles = [h for h, k in zip(self.handles, keep) if k]
+        for slot, dynamite in enumerate(self.handles):
+            dynamite.slot = slot
+        self.live = remaining
+        
+        return exploded
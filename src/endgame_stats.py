@@ -5,7 +5,7 @@ Displays match results, player rankings, and fun awards
 
 import pygame
 import math
-from src.config import *
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT
 
 class EndGameStats:
     """
@@ -16,17 +16,11 @@ class EndGameStats:
         self.screen = screen
         self.game_stats = game_stats  # Dictionary with player stats
         
-        # Fonts
-        try:
-            self.font_title = pygame.font.SysFont("impact", 48)
-            self.font_large = pygame.font.Font(None, 36)
-            self.font_medium = pygame.font.Font(None, 28)
-            self.font_small = pygame.font.Font(None, 24)
-        except:
-            self.font_title = pygame.font.Font(None, 48)
-            self.font_large = pygame.font.Font(None, 36)
-            self.font_medium = pygame.font.Font(None, 28)
-            self.font_small = pygame.font.Font(None, 24)
+        # Fonts (match_font returns None when Impact isn't installed, which picks the default font)
+        self.font_title = pygame.font.Font(pygame.font.match_font("impact"), 48)
+        self.font_large = pygame.font.Font(None, 36)
+        self.font_medium = pygame.font.Font(None, 28)
+        self.font_small = pygame.font.Font(None, 24)
         
         # Colors
         self.bg_color = (15, 15, 25)
@@ -41,10 +35,50 @@ class EndGameStats:
         
         # Buttons - moved higher up for better layout
         self.return_button = pygame.Rect(SCREEN_WIDTH//2 - 100, SCREEN_HEIGHT - 120, 200, 50)
+        self._button_bounds = (self.return_button.left, self.return_button.top,
+                               self.return_button.right, self.return_button.bottom)
+        
+        # Rendered text surfaces keyed by (font, text, color)
+        self._text_cache = {}
+        
+        # Pre-render the static labels once
+        self.title_surface = self._render_text(self.font_title, "MATCH RESULTS", self.title_color)
+        self.rankings_header = self._render_text(self.font_large, "FINAL RANKINGS", self.winner_color)
+        self.awards_header = self._render_text(self.font_large, "ACHIEVEMENTS", self.winner_color)
+        self.column_headers = [self._render_text(self.font_small, text, self.secondary_color)
+                               for text in ["RANK", "PLAYER", "KILLS", "DEATHS", "K/D"]]
+        self.return_button_text = self._render_text(self.font_medium, "RETURN TO MENU", self.text_color)
+        self.instructions_surface = self._render_text(self.font_small, "Press ESC or ENTER to return to menu",
+                                                      self.secondary_color)
         
         # Calculate stats and awards
         self.rankings = self._calculate_rankings()
         self.awards = self._calculate_awards()
+        
+        # Pre-render the scoreboard rows (stats never change after this point)
+        self._ranking_rows = self._build_ranking_rows()
+        self._award_surfaces = self._build_award_surfaces()
+        
+        # Return button in both hover states (hover is tracked from mouse motion)
+        self.button_normal = self._build_button((60, 60, 80))
+        self.button_hovered = self._build_button((80, 80, 100))
+        self._hovered = bool(self.return_button.collidepoint(pygame.mouse.get_pos()))
+        
+        # Everything except the bobbing title and the button hover state is static
+        self._background = self._build_background()
+        
+        # What the last frame drew, so later frames only touch what changed
+        self._title_rect = None  # None until the first full frame is drawn
+        self._drawn_hovered = None
+    
+    def _render_text(self, font, text, color):
+        """Render text, reusing the surface if it was rendered before"""
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surface
+        return surface
     
     def _calculate_rankings(self):
         """Calculate player rankings sorted by kills"""
@@ -80,36 +114,143 @@ class EndGameStats:
         
         awards = {}
         
-        # 🏆 Champion (most kills)
-        champion = max(self.rankings, key=lambda x: x['kills'])
-        if champion['kills'] > 0:
-            awards['champion'] = champion
-        
-        # 💀 Eliminator (most aggressive - most total kills + deaths)
-        eliminator = max(self.rankings, key=lambda x: x['kills'] + x['deaths'])
-        if eliminator['kills'] + eliminator['deaths'] > 0:
-            awards['eliminator'] = eliminator
-        
-        # 🛡️ Survivor (fewest deaths, but must have participated)
-        survivors = [p for p in self.rankings if p['kills'] > 0 or p['deaths'] > 0]
-        if survivors:
-            survivor = min(survivors, key=lambda x: x['deaths'])
-            awards['survivor'] = survivor
-        
-        # 🎯 Sharpshooter (best K/D ratio, minimum 2 kills)
-        sharpshooters = [p for p in self.rankings if p['kills'] >= 2]
-        if sharpshooters:
-            sharpshooter = max(sharpshooters, key=lambda x: x['kd_ratio'])
-            awards['sharpshooter'] = sharpshooter
-        
-        # 🤦 Fumbler (most fall/self deaths)
-        fumbler_deaths = [(p, p['fall_deaths'] + p['self_deaths']) for p in self.rankings]
-        fumbler_deaths.sort(key=lambda x: x[1], reverse=True)
-        if fumbler_deaths and fumbler_deaths[0][1] > 0:
-            awards['fumbler'] = fumbler_deaths[0][0]
+        # Track every award in a single pass (ties go to the higher-ranked player)
+        most_kills = 0
+        most_action = 0
+        most_accidents = 0
+        fewest_deaths = None
+        best_kd = None
+        
+        for player in self.rankings:
+            kills = player['kills']
+            deaths = player['deaths']
+            
+            # 🏆 Champion (most kills)
+            if kills > most_kills:
+                most_kills = kills
+                awards['champion'] = player
+            
+            # 💀 Eliminator (most aggressive - most total kills + deaths)
+            if kills + deaths > most_action:
+                most_action = kills + deaths
+                awards['eliminator'] = player
+            
+            # 🛡️ Survivor (fewest deaths, but must have participated)
+            if (kills > 0 or deaths > 0) and (fewest_deaths is None or deaths < fewest_deaths):
+                fewest_deaths = deaths
+                awards['survivor'] = player
+            
+            # 🎯 Sharpshooter (best K/D ratio, minimum 2 kills)
+            if kills >= 2 and (best_kd is None or player['kd_ratio'] > best_kd):
+                best_kd = player['kd_ratio']
+                awards['sharpshooter'] = player
+            
+            # 🤦 Fumbler (most fall/self deaths)
+            accidents = player['fall_deaths'] + player['self_deaths']
+            if accidents > most_accidents:
+                most_accidents = accidents
+                awards['fumbler'] = player
         
         return awards
     
+    def _build_ranking_rows(self):
+        """Pre-render the rank, name, kills, deaths and K/D text for the top 4 players"""
+        rows = []
+        for i, player in enumerate(self.rankings[:4]):  # Show top 4
+            rank_color = self.winner_color if i == 0 else self.text_color
+            
+            # Rank with special formatting for winner
+            rank_text = f"{i + 1}."
+            if i == 0:
+                rank_text = "[#1]"  # Text symbol instead of emoji
+            
+            # K/D ratio with proper formatting
+            if player['deaths'] == 0:
+                if player['kills'] == 0:
+                    kd_text = "0.00"  # 0 kills and 0 deaths
+                else:
+                    kd_text = "∞"  # Kills with no deaths
+            else:
+                kd_text = f"{player['kd_ratio']:.2f}"  # Normal ratio
+            
+            rows.append((
+                self._render_text(self.font_medium, rank_text, rank_color),
+                self._render_text(self.font_medium, player['name'], rank_color),
+                self._render_text(self.font_medium, str(player['kills']), rank_color),
+                self._render_text(self.font_medium, str(player['deaths']), rank_color),
+                self._render_text(self.font_medium, kd_text, rank_color),
+                player['color']
+            ))
+        return rows
+    
+    def _build_award_surfaces(self):
+        """Pre-render the title and winner line of every award"""
+        # Award definitions with text symbols instead of emojis
+        award_info = {
+            'champion': ('[CHAMPION]', 'Most eliminations'),
+            'eliminator': ('[ELIMINATOR]', 'Most aggressive'),
+            'survivor': ('[SURVIVOR]', 'Fewest deaths'),
+            'sharpshooter': ('[SHARPSHOOTER]', 'Best K/D ratio'),
+            'fumbler': ('[FUMBLER]', 'Most accidents')
+        }
+        
+        surfaces = []
+        for award_key, (award_title, award_desc) in award_info.items():
+            if award_key in self.awards:
+                player = self.awards[award_key]
+                player_text = f"{player['name']} - {award_desc}"
+                surfaces.append((
+                    self._render_text(self.font_medium, award_title, self.award_color),
+                    self._render_text(self.font_small, player_text, self.text_color),
+                    player['color']
+                ))
+            else:
+                # No award winner - no color indicator
+                surfaces.append((
+                    self._render_text(self.font_medium, award_title, self.secondary_color),
+                    self._render_text(self.font_small, "No winner", self.secondary_color),
+                    None
+                ))
+        return surfaces
+    
+    def _build_button(self, button_color):
+        """Pre-render the return to menu button with the given background color"""
+        button = pygame.Surface(self.return_button.size).convert()
+        button_rect = button.get_rect()
+        
+        # Button background
+        button.fill(button_color)
+        pygame.draw.rect(button, self.text_color, button_rect, 2)
+        
+        # Button text
+        button_text = self.return_button_text
+        button.blit(button_text, button_text.get_rect(center=button_rect.center))
+        return button
+    
+    def _build_background(self):
+        """Compose the static parts of the screen into a single surface"""
+        background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        background.fill(self.bg_color)
+        
+        # Main content area - moved down to give more space
+        content_y = 100
+        
+        # Left side - Rankings
+        self._render_rankings(background, 50, content_y)
+        
+        # Right side - Awards
+        self._render_awards(background, SCREEN_WIDTH//2 + 50, content_y)
+        
+        # Instructions - moved higher up
+        inst_surface = self.instructions_surface
+        inst_rect = inst_surface.get_rect(centerx=SCREEN_WIDTH//2, y=SCREEN_HEIGHT - 65)
+        background.blit(inst_surface, inst_rect)
+        
+        # Return button in its normal state
+        background.blit(self.button_normal, self.return_button)
+        
+        return background
+    
     def handle_event(self, event):
         """Handle input events"""
         if event.type == pygame.QUIT:
@@ -117,9 +258,16 @@ class EndGameStats:
         elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE or event.key == pygame.K_RETURN:
                 return "menu"
+        elif event.type == pygame.MOUSEMOTION:
+            x, y = event.pos
+            left, top, right, bottom = self._button_bounds
+            self._hovered = left <= x < right and top <= y < bottom
         elif event.type == pygame.MOUSEBUTTONDOWN:
-            if event.button == 1 and self.return_button.collidepoint(event.pos):
-                return "menu"
+            if event.button == 1:
+                x, y = event.pos
+                left, top, right, bottom = self._button_bounds
+                if left <= x < right and top <= y < bottom:
+                    return "menu"
         return None
     
     def update(self, dt):
@@ -127,155 +275,99 @@ class EndGameStats:
         self.animation_time += dt
     
     def render(self):
-        """Render the stats screen"""
-        self.screen.fill(self.bg_color)
+        """Render the stats screen and return the screen rects that changed"""
+        dirty_rects = []
+        
+        if self._title_rect is None:
+            # First frame - static rankings, awards, instructions and button
+            self.screen.blit(self._background, (0, 0))
+            dirty_rects.append(self.screen.get_rect())
+        else:
+            # Restore the background under last frame's title
+            self.screen.blit(self._background, self._title_rect, self._title_rect)
         
         # Title with animation
         title_y = 40 + math.sin(self.animation_time * 2) * 3
-        title = self.font_title.render("MATCH RESULTS", True, self.title_color)
+        title = self.title_surface
         title_rect = title.get_rect(centerx=SCREEN_WIDTH//2, y=title_y)
         self.screen.blit(title, title_rect)
+        if self._title_rect is not None:
+            dirty_rects.append(title_rect.union(self._title_rect))
+        self._title_rect = title_rect
         
-        # Main content area - moved down to give more space
-        content_y = 100
-        
-        # Left side - Rankings
-        self._render_rankings(50, content_y)
+        # Return button (only redrawn when the hover state changes)
+        if self._hovered != self._drawn_hovered:
+            self._render_return_button()
+            dirty_rects.append(self.return_button)
+            self._drawn_hovered = self._hovered
         
-        # Right side - Awards
-        self._render_awards(SCREEN_WIDTH//2 + 50, content_y)
-        
-        # Return button
-        self._render_return_button()
+        return dirty_rects
     
-    def _render_rankings(self, x, y):
-        """Render player rankings"""
+    def _render_rankings(self, surface, x, y):
+        """Render player rankings onto surface"""
         current_y = y
         
         # Header
-        header = self.font_large.render("FINAL RANKINGS", True, self.winner_color)
-        self.screen.blit(header, (x, current_y))
+        header = self.rankings_header
+        surface.blit(header, (x, current_y))
         current_y += 50
         
         # Column headers
-        headers = ["RANK", "PLAYER", "KILLS", "DEATHS", "K/D"]
         header_x_positions = [x, x + 60, x + 200, x + 280, x + 360]
         
-        for i, header_text in enumerate(headers):
-            header_surface = self.font_small.render(header_text, True, self.secondary_color)
-            self.screen.blit(header_surface, (header_x_positions[i], current_y))
+        for i, header_surface in enumerate(self.column_headers):
+            surface.blit(header_surface, (header_x_positions[i], current_y))
         current_y += 30
         
         # Player rankings
-        for i, player in enumerate(self.rankings[:4]):  # Show top 4
-            rank_color = self.winner_color if i == 0 else self.text_color
-            
-            # Rank with special formatting for winner
-            rank_text = f"{i + 1}."
-            if i == 0:
-                rank_text = "[#1]"  # Text symbol instead of emoji
-            rank_surface = self.font_medium.render(rank_text, True, rank_color)
-            self.screen.blit(rank_surface, (header_x_positions[0], current_y))
+        for rank_surface, name_surface, kills_surface, deaths_surface, kd_surface, player_color in self._ranking_rows:
+            surface.blit(rank_surface, (header_x_positions[0], current_y))
             
             # Player name with color indicator
-            name_surface = self.font_medium.render(player['name'], True, rank_color)
-            self.screen.blit(name_surface, (header_x_positions[1], current_y))
+            surface.blit(name_surface, (header_x_positions[1], current_y))
             
             # Color indicator
             color_rect = pygame.Rect(header_x_positions[1] - 20, current_y + 5, 12, 12)
-            pygame.draw.rect(self.screen, player['color'], color_rect)
-            pygame.draw.rect(self.screen, self.text_color, color_rect, 1)
-            
-            # Kills
-            kills_surface = self.font_medium.render(str(player['kills']), True, rank_color)
-            self.screen.blit(kills_surface, (header_x_positions[2], current_y))
+            pygame.draw.rect(surface, player_color, color_rect)
+            pygame.draw.rect(surface, self.text_color, color_rect, 1)
             
-            # Deaths
-            deaths_surface = self.font_medium.render(str(player['deaths']), True, rank_color)
-            self.screen.blit(deaths_surface, (header_x_positions[3], current_y))
-            
-            # K/D ratio with proper formatting
-            if player['deaths'] == 0:
-                if player['kills'] == 0:
-                    kd_text = "0.00"  # 0 kills and 0 deaths
-                else:
-                    kd_text = "∞"  # Kills with no deaths
-            else:
-                kd_text = f"{player['kd_ratio']:.2f}"  # Normal ratio
-            kd_surface = self.font_medium.render(kd_text, True, rank_color)
-            self.screen.blit(kd_surface, (header_x_positions[4], current_y))
+            # Kills, deaths and K/D ratio
+            surface.blit(kills_surface, (header_x_positions[2], current_y))
+            surface.blit(deaths_surface, (header_x_positions[3], current_y))
+            surface.blit(kd_surface, (header_x_positions[4], current_y))
             
             current_y += 35
     
-    def _render_awards(self, x, y):
-        """Render awards section"""
+    def _render_awards(self, surface, x, y):
+        """Render awards section onto surface"""
         current_y = y
         
         # Header
-        header = self.font_large.render("ACHIEVEMENTS", True, self.winner_color)
-        self.screen.blit(header, (x, current_y))
+        header = self.awards_header
+        surface.blit(header, (x, current_y))
         current_y += 50
         
-        # Award definitions with text symbols instead of emojis
-        award_info = {
-            'champion': ('[CHAMPION]', 'Most eliminations'),
-            'eliminator': ('[ELIMINATOR]', 'Most aggressive'),
-            'survivor': ('[SURVIVOR]', 'Fewest deaths'),
-            'sharpshooter': ('[SHARPSHOOTER]', 'Best K/D ratio'),
-            'fumbler': ('[FUMBLER]', 'Most accidents')
-        }
-        
         # Render each award
-        for award_key, (award_title, award_desc) in award_info.items():
-            if award_key in self.awards:
-                player = self.awards[award_key]
-                
-                # Award title
-                title_surface = self.font_medium.render(award_title, True, self.award_color)
-                self.screen.blit(title_surface, (x, current_y))
-                current_y += 25
-                
-                # Player name and description
-                player_text = f"{player['name']} - {award_desc}"
-                player_surface = self.font_small.render(player_text, True, self.text_color)
-                self.screen.blit(player_surface, (x + 20, current_y))
-                
+        for title_surface, detail_surface, player_color in self._award_surfaces:
+            # Award title
+            surface.blit(title_surface, (x, current_y))
+            current_y += 25
+            
+            # Player name and description (or "No winner")
+            surface.blit(detail_surface, (x + 20, current_y))
+            
+            if player_color is not None:
                 # Color indicator
                 color_rect = pygame.Rect(x, current_y + 3, 12, 12)
-                pygame.draw.rect(self.screen, player['color'], color_rect)
-                pygame.draw.rect(self.screen, self.text_color, color_rect, 1)
-                
-                current_y += 40
-            else:
-                # No award winner
-                title_surface = self.font_medium.render(award_title, True, self.secondary_color)
-                self.screen.blit(title_surface, (x, current_y))
-                current_y += 25
-                
-                no_winner = self.font_small.render("No winner", True, self.secondary_color)
-                self.screen.blit(no_winner, (x + 20, current_y))
-                current_y += 40
+                pygame.draw.rect(surface, player_color, color_rect)
+                pygame.draw.rect(surface, self.text_color, color_rect, 1)
+            
+            current_y += 40
     
     def _render_return_button(self):
-        """Render the return to menu button"""
-        # Button background
-        mouse_pos = pygame.mouse.get_pos()
-        is_hovered = self.return_button.collidepoint(mouse_pos)
-        button_color = (60, 60, 80) if not is_hovered else (80, 80, 100)
-        
-        pygame.draw.rect(self.screen, button_color, self.return_button)
-        pygame.draw.rect(self.screen, self.text_color, self.return_button, 2)
-        
-        # Button text
-        button_text = self.font_medium.render("RETURN TO MENU", True, self.text_color)
-        button_rect = button_text.get_rect(center=self.return_button.center)
-        self.screen.blit(button_text, button_rect)
-        
-        # Instructions - moved higher up
-        instructions = "Press ESC or ENTER to return to menu"
-        inst_surface = self.font_small.render(instructions, True, self.secondary_color)
-        inst_rect = inst_surface.get_rect(centerx=SCREEN_WIDTH//2, y=SCREEN_HEIGHT - 65)
-        self.screen.blit(inst_surface, inst_rect)
+        """Render the return to menu button in its current hover state"""
+        button = self.button_hovered if self._hovered else self.button_normal
+        self.screen.blit(button, self.return_button)
 
 def show_endgame_stats(screen, game_stats):
     """
@@ -297,7 +389,6 @@ def show_endgame_stats(screen, game_stats):
                 return True
         
         stats_screen.update(dt)
-        stats_screen.render()
-        pygame.display.flip()
+        pygame.display.update(stats_screen.render())
     
     return True
\ No newline at end of file
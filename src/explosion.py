@@ -5,8 +5,63 @@ Handles explosion animations and damage logic for all explosive tools
 
 import pygame
 import math
-import random
-from src.config import *
+import numpy as np
+from src.config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, DYNAMITE_RADIUS, DYNAMITE_BASE_DAMAGE,
+    EXPLOSION_PARTICLE_DENSITY, EXPLOSION_DURATION, EXPLOSION_MIN_DAMAGE,
+)
+
+# Shared random generator for particle creation
+_rng = np.random.default_rng()
+
+# Particle color types
+_FIRE, _SMOKE, _DEBRIS = 0, 1, 2
+
+# Pre-rendered particle sprites keyed by (color_type, life_bucket, size)
+_PARTICLE_ATLAS = {}
+_LIFE_BUCKETS = 64
+_PARTICLE_SIZES = range(2, 7)
+
+def _particle_color(color_type, life):
+    """Calculate particle color based on type and life"""
+    if color_type == _FIRE:
+        # Fire particles: yellow to red to black
+        if life > 0.7:
+            return (255, 255, int(255 * life))  # Bright yellow
+        elif life > 0.3:
+            return (255, int(255 * life), 0)  # Orange to red
+        else:
+            return (int(255 * life), 0, 0)  # Dark red to black
+    elif color_type == _SMOKE:
+        # Smoke particles: white to gray to black
+        gray = int(128 * life)
+        return (gray, gray, gray)
+    else:  # debris
+        # Debris particles: brown/gray chunks
+        brown = int(139 * life)
+        return (brown, int(69 * life), int(19 * life))
+
+def _build_color_lut():
+    """Evaluate the particle color for every color type and life bucket"""
+    lut = np.empty((3, _LIFE_BUCKETS, 3), dtype=np.uint8)
+    for color_type in (_FIRE, _SMOKE, _DEBRIS):
+        for life_bucket in range(_LIFE_BUCKETS):
+            lut[color_type, life_bucket] = _particle_color(color_type, life_bucket / (_LIFE_BUCKETS - 1))
+    return lut
+
+# Particle colors indexed by (color_type, life_bucket)
+_COLOR_LUT = _build_color_lut()
+
+def _build_particle_atlas():
+    """Pre-render one particle sprite per color type, life bucket and size"""
+    for color_type in (_FIRE, _SMOKE, _DEBRIS):
+        for life_bucket in range(_LIFE_BUCKETS):
+            color = _COLOR_LUT[color_type, life_bucket].tolist()
+            alpha = int(255 * life_bucket / (_LIFE_BUCKETS - 1))
+            for size in _PARTICLE_SIZES:
+                particle_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA).convert_alpha()
+                particle_surf.fill((*color, alpha))
+                _PARTICLE_ATLAS[color_type, life_bucket, size] = particle_surf
 
 class Explosion:
     def __init__(self, x, y, radius, damage, source_worm=None):
@@ -17,53 +72,57 @@ class Explosion:
         self.source_worm = source_worm
         
         # Animation properties
-        self.start_time = pygame.time.get_ticks()
+        self.elapsed_ms = 0.0  # Advanced from dt in update()
         self.duration = EXPLOSION_DURATION  # milliseconds
         self.current_radius = 0
         self.is_active = True
+        self.on_screen = True  # Visibility from the last render
+        
+        # Radius ramp breakpoints (ms) and rates, so update() needs no divides
+        self._grow_end = 0.3 * self.duration
+        self._shrink_start = 0.7 * self.duration
+        self._grow_rate = self.radius / self._grow_end
+        self._shrink_rate = self.radius / (self.duration - self._shrink_start)
         
-        # Particle system for explosion effect
-        self.particles = []
+        # Shockwave surface sized for the full radius, reused every frame
+        self._shock_surf = pygame.Surface((int(self.radius * 2), int(self.radius * 2)), pygame.SRCALPHA).convert_alpha()
+        
+        # Particle system for explosion effect (one array per particle field)
+        if not _PARTICLE_ATLAS:
+            _build_particle_atlas()
         self._create_particles()
         
     def _create_particles(self):
         """Create particles for explosion animation"""
         particle_count = int(self.radius * EXPLOSION_PARTICLE_DENSITY)  # More particles for bigger explosions
         
-        for _ in range(particle_count):
-            # Random angle and distance
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(0, self.radius)
-            
-            # Calculate particle position
-            px = self.x + math.cos(angle) * distance
-            py = self.y + math.sin(angle) * distance
-            
-            # Random velocity (particles fly outward)
-            speed = random.uniform(50, 200)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            
-            # Create particle
-            particle = {
-                'x': px,
-                'y': py,
-                'vx': vx,
-                'vy': vy,
-                'life': 1.0,  # Full life at start
-                'decay_rate': random.uniform(1.5, 3.0),  # How fast it fades
-                'size': random.randint(2, 6),
-                'color_type': random.choice(['fire', 'smoke', 'debris'])
-            }
-            self.particles.append(particle)
+        # Random angle and distance
+        angles = _rng.uniform(0, 2 * math.pi, particle_count)
+        distances = _rng.uniform(0, self.radius, particle_count)
+        cos = np.cos(angles)
+        sin = np.sin(angles)
+        
+        # Calculate particle positions
+        self.px = self.x + cos * distances
+        self.py = self.y + sin * distances
+        
+        # Random velocity (particles fly outward)
+        speeds = _rng.uniform(50, 200, particle_count)
+        self.vx = cos * speeds
+        self.vy = sin * speeds
+        
+        self.life = np.ones(particle_count, dtype=np.float32)  # Full life at start
+        self.decay = _rng.uniform(1.5, 3.0, particle_count).astype(np.float32)  # How fast it fades
+        self.size = _rng.integers(2, 7, particle_count, dtype=np.int32)
+        self.color_type = _rng.integers(0, 3, particle_count, dtype=np.int8)  # _FIRE, _SMOKE or _DEBRIS
     
     def update(self, dt):
         """Update explosion animation"""
         if not self.is_active:
             return False
             
-        current_time = pygame.time.get_ticks()
-        elapsed = current_time - self.start_time
+        self.elapsed_ms += dt * 1000.0
+        elapsed = self.elapsed_ms
         
         # Check if explosion is finished
         if elapsed >= self.duration:
@@ -71,37 +130,45 @@ class Explosion:
             return False
             
         # Update explosion radius (grows quickly then shrinks)
-        progress = elapsed / self.duration
-        if progress < 0.3:
+        if elapsed < self._grow_end:
             # Rapid expansion phase
-            self.current_radius = (progress / 0.3) * self.radius
-        elif progress < 0.7:
+            self.current_radius = elapsed * self._grow_rate
+        elif elapsed < self._shrink_start:
             # Full size phase
             self.current_radius = self.radius
         else:
             # Shrinking phase
-            shrink_progress = (progress - 0.7) / 0.3
-            self.current_radius = self.radius * (1.0 - shrink_progress)
+            self.current_radius = (self.duration - elapsed) * self._shrink_rate
         
         # Update particles
-        for particle in self.particles[:]:  # Copy list to safely modify
-            # Update position
-            particle['x'] += particle['vx'] * dt
-            particle['y'] += particle['vy'] * dt
-            
-            # Apply gravity to particles
-            particle['vy'] += 200 * dt  # Gravity effect
-            
-            # Apply air resistance
-            particle['vx'] *= 0.98
-            particle['vy'] *= 0.98
+        if len(self.life):
+            # Off-screen particles skip physics and just burn out
+            if self.on_screen:
+                # Update position
+                self.px += self.vx * dt
+                self.py += self.vy * dt
+                
+                # Apply gravity to particles
+                self.vy += 200 * dt  # Gravity effect
+                
+                # Apply air resistance
+                self.vx *= 0.98
+                self.vy *= 0.98
             
             # Decay life
-            particle['life'] -= particle['decay_rate'] * dt
+            self.life -= self.decay * dt
             
             # Remove dead particles
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+            keep = self.life > 0
+            if not keep.all():
+                self.px = self.px[keep]
+                self.py = self.py[keep]
+                self.vx = self.vx[keep]
+                self.vy = self.vy[keep]
+                self.life = self.life[keep]
+                self.decay = self.decay[keep]
+                self.size = self.size[keep]
+                self.color_type = self.color_type[keep]
         
         return True
     
@@ -114,8 +181,9 @@ class Explosion:
         screen_y = self.y - camera_y
         
         # Only render if visible on screen
-        if (-self.radius <= screen_x <= SCREEN_WIDTH + self.radius and 
-            -self.radius <= screen_y <= SCREEN_HEIGHT + self.radius):
+        self.on_screen = (-self.radius <= screen_x <= SCREEN_WIDTH + self.radius and 
+                          -self.radius <= screen_y <= SCREEN_HEIGHT + self.radius)
+        if self.on_screen:
             
             # Render main explosion circle (shockwave effect)
             if self.current_radius > 0:
@@ -123,114 +191,78 @@ class Explosion:
                 alpha = int(255 * (self.current_radius / self.radius) * 0.3)
                 shockwave_color = (255, 200, 100, alpha)  # Orange with transparency
                 
-                try:
-                    # Create surface for alpha blending
-                    explosion_surf = pygame.Surface((self.current_radius * 2, self.current_radius * 2), pygame.SRCALPHA)
-                    pygame.draw.circle(explosion_surf, shockwave_color, 
-                                     (int(self.current_radius), int(self.current_radius)), 
-                                     int(self.current_radius), 3)
-                    screen.blit(explosion_surf, (int(screen_x - self.current_radius), 
-                                               int(screen_y - self.current_radius)))
-                except:
-                    # Fallback to regular circle if alpha blending fails
-                    pygame.draw.circle(screen, (255, 200, 100), 
-                                     (int(screen_x), int(screen_y)), 
-                                     int(self.current_radius), 3)
+                # Clear and redraw only the part of the shared surface in use
+                radius = int(self.current_radius)
+                shock_area = (0, 0, radius * 2, radius * 2)
+                self._shock_surf.fill((0, 0, 0, 0), shock_area)
+                pygame.draw.circle(self._shock_surf, shockwave_color, (radius, radius), radius, 3)
+                screen.blit(self._shock_surf, (int(screen_x - self.current_radius), 
+                                               int(screen_y - self.current_radius)), shock_area)
+            
+            # Skip particles outside screen (one mask for the whole array)
+            particle_xs = self.px - camera_x
+            particle_ys = self.py - camera_y
+            visible = np.flatnonzero((particle_xs >= -10) & (particle_xs <= SCREEN_WIDTH + 10) &
+                                     (particle_ys >= -10) & (particle_ys <= SCREEN_HEIGHT + 10))
             
             # Render particles
-            for particle in self.particles:
-                if particle['life'] <= 0:
-                    continue
-                    
-                particle_screen_x = particle['x'] - camera_x
-                particle_screen_y = particle['y'] - camera_y
-                
-                # Skip particles outside screen
-                if (particle_screen_x < -10 or particle_screen_x > SCREEN_WIDTH + 10 or
-                    particle_screen_y < -10 or particle_screen_y > SCREEN_HEIGHT + 10):
-                    continue
-                
-                # Calculate particle color based on type and life
-                life = max(0, min(1, particle['life']))
-                alpha = int(255 * life)
-                
-                if particle['color_type'] == 'fire':
-                    # Fire particles: yellow to red to black
-                    if life > 0.7:
-                        color = (255, 255, int(255 * life))  # Bright yellow
-                    elif life > 0.3:
-                        color = (255, int(255 * life), 0)  # Orange to red
-                    else:
-                        color = (int(255 * life), 0, 0)  # Dark red to black
-                elif particle['color_type'] == 'smoke':
-                    # Smoke particles: white to gray to black
-                    gray = int(128 * life)
-                    color = (gray, gray, gray)
-                else:  # debris
-                    # Debris particles: brown/gray chunks
-                    brown = int(139 * life)
-                    color = (brown, int(69 * life), int(19 * life))
-                
-                # Draw particle
-                try:
-                    particle_surf = pygame.Surface((particle['size'] * 2, particle['size'] * 2), pygame.SRCALPHA)
-                    particle_surf.fill((*color, alpha))
-                    screen.blit(particle_surf, (int(particle_screen_x - particle['size']), 
-                                              int(particle_screen_y - particle['size'])))
-                except:
-                    # Fallback to regular circle
-                    pygame.draw.circle(screen, color, 
-                                     (int(particle_screen_x), int(particle_screen_y)), 
-                                     particle['size'])
+            particles = zip(particle_xs[visible].tolist(), particle_ys[visible].tolist(),
+                            self.life[visible].tolist(), self.size[visible].tolist(),
+                            self.color_type[visible].tolist())
+            for particle_screen_x, particle_screen_y, life, size, color_type in particles:
+                # Pre-rendered sprite for this type, life and size
+                life_bucket = int(life * (_LIFE_BUCKETS - 1) + 0.5)
+                screen.blit(_PARTICLE_ATLAS[color_type, life_bucket, size],
+                            (int(particle_screen_x - size), int(particle_screen_y - size)))
     
     def apply_damage(self, worms):
         """Apply explosion damage to all worms in range"""
         damaged_worms = []
+        radius_sq = self.radius * self.radius
         
-        for worm in worms:
-            if worm.is_dead:
-                continue
-                
-            # Get worm position
-            worm_x, worm_y = worm.body_segments[0]
+        living_worms = [worm for worm in worms if not worm.is_dead]
+        if not living_worms:
+            return damaged_worms
+        
+        # Squared distance from explosion center to every worm head in one pass
+        heads = np.array([worm.body_segments[0] for worm in living_worms], dtype=float)
+        dx = heads[:, 0] - self.x
+        dy = heads[:, 1] - self.y
+        distances_sq = dx * dx + dy * dy
+        
+        # Only take the root for worms in range
+        for i in np.flatnonzero(distances_sq <= radius_sq):
+            worm = living_worms[i]
+            distance = math.sqrt(distances_sq[i])
             
-            # Calculate distance from explosion center
-            distance = math.sqrt((worm_x - self.x)**2 + (worm_y - self.y)**2)
+            # Calculate damage based on distance (closer = more damage)
+            damage = max(EXPLOSION_MIN_DAMAGE, self.base_damage - int(distance))
             
-            if distance <= self.radius:
-                # Calculate damage based on distance (closer = more damage)
-                damage = max(EXPLOSION_MIN_DAMAGE, self.base_damage - int(distance))
-                
-                # Apply damage
-                damage_result = worm.take_damage(damage, self.source_worm)
-                needs_death_handling = (damage_result and isinstance(damage_result, dict) 
-                                      and damage_result.get('needs_death_handling'))
-                damaged_worms.append((worm, damage, distance, needs_death_handling, damage_result))
+            # Apply damage
+            damage_result = worm.take_damage(damage, self.source_worm)
+            needs_death_handling = (damage_result and isinstance(damage_result, dict) 
+                                  and damage_result.get('needs_death_handling'))
+            damaged_worms.append((worm, damage, distance, needs_death_handling, damage_result))
         
         return damaged_worms
     
     def is_finished(self):
         """Check if explosion animation is complete"""
-        return not self.is_active and len(self.particles) == 0
+        return not self.is_active and len(self.life) == 0
 
 # Preset explosion types for easy use
-class ExplosionPresets:
-    @staticmethod
-    def dynamite_explosion(x, y, source_worm=None):
-        """Create a standard dynamite explosion"""
-        return Explosion(x, y, DYNAMITE_RADIUS, DYNAMITE_BASE_DAMAGE, source_worm)
-    
-    @staticmethod
-    def small_explosion(x, y, source_worm=None):
-        """Create a small explosion (e.g., for grenades)"""
-        return Explosion(x, y, DYNAMITE_RADIUS // 2, DYNAMITE_BASE_DAMAGE // 2, source_worm)
-    
-    @staticmethod
-    def large_explosion(x, y, source_worm=None):
-        """Create a large explosion (e.g., for rockets)"""
-        return Explosion(x, y, DYNAMITE_RADIUS * 1.5, DYNAMITE_BASE_DAMAGE * 1.2, source_worm)
-    
-    @staticmethod
-    def custom_explosion(x, y, radius, damage, source_worm=None):
-        """Create a custom explosion with specified parameters"""
-        return Explosion(x, y, radius, damage, source_worm)
\ No newline at end of file
+def dynamite_explosion(x, y, source_worm=None):
+    """Create a standard dynamite explosion"""
+    return Explosion(x, y, DYNAMITE_RADIUS, DYNAMITE_BASE_DAMAGE, source_worm)
+
+def small_explosion(x, y, source_worm=None):
+    """Create a small explosion (e.g., for grenades)"""
+    return Explosion(x, y, DYNAMITE_RADIUS // 2, DYNAMITE_BASE_DAMAGE // 2, source_worm)
+
+def large_explosion(x, y, source_worm=None):
+    """Create a large explosion (e.g., for rockets)"""
+    return Explosion(x, y, DYNAMITE_RADIUS * 1.5, DYNAMITE_BASE_DAMAGE * 1.2, source_worm)
+
+def custom_explosion(x, y, radius, damage, source_worm=None):
+    """Create a custom explosion with specified parameters"""
+    return Explosion(x, y, radius, damage, source_worm)
@@ -5,15 +5,194 @@ Handles overall game state, coordination between systems
 
 import pygame
 import math
-import time
-import random
+import numpy as np
+from collections import deque, OrderedDict
 from src.terrain import Terrain
 from src.worm import Worm
-from src.explosion import Explosion, ExplosionPresets
+from src.explosion import Explosion, dynamite_explosion
 from src.tombstone import Tombstone
-from src.config import *
+from src.dynamite_pool import DynamitePool
+from src.config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, WHITE, GREEN, RED, YELLOW, GRAY, CYAN,
+    DYNAMITE_INDICATOR_COLOR, TILE_SIZE, UI_HEIGHT, MAP_WIDTH, MAP_HEIGHT, WORM_RADIUS,
+    DRILL_WIDTH, DRILL_DEPTH, DYNAMITE_RADIUS, TORCH_RANGE, TORCH_CONE_ANGLE, LASER_WIDTH,
+    DRILL_DAMAGE, LASER_DAMAGE, TORCH_DAMAGE, MIN_SPAWN_DISTANCE, MAX_GAS,
+    BATTLE_TIMER_WARNING_TIME, BATTLE_TIMER_FLASH_RATE, FIXED_DT, MAX_STEPS_PER_FRAME,
+    EXPLOSION_MIN_DAMAGE,
+)
+
+# Wormhole rings (outer radius in pixels). Only every other segment is drawn, so each
+# ring's pattern repeats every two segments and can be pre-rendered in rotation steps.
+_WORMHOLE_MAX_RADIUS = 60
+_WORMHOLE_NUM_RINGS = 8
+_WORMHOLE_SEGMENTS = 12
+_WORMHOLE_ROTATION_PERIOD = 2 * (2 * math.pi / _WORMHOLE_SEGMENTS)
+_WORMHOLE_ROTATION_STEPS = 30
+_WORMHOLE_GLOW_STEPS = 32  # Pre-rendered glow sizes across one pulse
+_WORMHOLE_EXTENT = 100  # Reach of the outermost sparkle (70 + 20 orbit swing + size), rounded up
+
+# Swirling wormhole ring colors (purple to blue to white)
+_WORMHOLE_COLORS = (
+    (75, 0, 130),    # Indigo
+    (138, 43, 226),  # Blue Violet
+    (0, 191, 255),   # Deep Sky Blue
+    (255, 255, 255)  # White (center)
+)
+
+# Sparkles around the wormhole, each with its own animation offset
+_SPARKLE_INDEX = np.arange(12)
+_SPARKLE_OFFSETS = _SPARKLE_INDEX * 0.5
+_SPARKLE_BASE_ANGLES = _SPARKLE_INDEX * 2 * math.pi / len(_SPARKLE_INDEX)
+
+# Every sparkle wave as sin(freq * t + phase), one row each:
+# orbit cos, orbit sin, distance, size, brightness (cos(a) == sin(a + pi/2))
+_SPARKLE_WAVE_FREQS = np.array([0.5, 0.5, 2.0, 3.0, 4.0])[:, None]
+_SPARKLE_WAVE_PHASES = np.stack([_SPARKLE_BASE_ANGLES + math.pi / 2, _SPARKLE_BASE_ANGLES,
+                                 np.zeros(12), np.zeros(12), np.zeros(12)]) + _SPARKLE_WAVE_FREQS * _SPARKLE_OFFSETS
+
+# Keys that belong to each keyboard player
+_P1_KEYS = frozenset((pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s, pygame.K_f, pygame.K_SPACE, pygame.K_q, pygame.K_e))
+_P2_KEYS = frozenset((pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN, pygame.K_RCTRL, pygame.K_COMMA, pygame.K_MINUS, pygame.K_PERIOD))
+_KEY_TO_PLAYER = {**dict.fromkeys(_P1_KEYS, 1), **dict.fromkeys(_P2_KEYS, 2)}
+
+# HUD bar colors as (ratio the bar must be above, color), highest band first; RED below all
+_HP_BANDS = ((0.6, GREEN), (0.3, YELLOW))
+_GAS_BANDS = ((0.3, GREEN), (0.1, YELLOW))
+_BATTERY_BANDS = ((0.6, CYAN), (0.3, YELLOW))  # Cyan for high battery (laser color)
+
+# Rendered text surfaces kept in the UI text cache
+_TEXT_CACHE_SIZE = 512
+
+# Frame times this close to FIXED_DT (seconds) run exactly one simulation step
+_STEP_SNAP = 0.001
+
+# Seconds between FPS label refreshes
+_FPS_LABEL_INTERVAL = 0.15
+
+# Event types the game reacts to (mouse clicks and motion aim tools, or drive the quit menu)
+_GAME_EVENT_TYPES = frozenset((pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION,
+                               pygame.WINDOWFOCUSLOST, pygame.WINDOWFOCUSGAINED))
+
+# Squared distance thresholds (compare against dx*dx + dy*dy, no square root)
+_TORCH_RANGE_SQ = TORCH_RANGE * TORCH_RANGE
+_MIN_SPAWN_DISTANCE_SQ = MIN_SPAWN_DISTANCE * MIN_SPAWN_DISTANCE
+
+# Distance from the wormhole center that counts as reaching it
+_GOAL_RADIUS = 50
+_GOAL_RADIUS_SQ = _GOAL_RADIUS * _GOAL_RADIUS
+
+def _band_color(ratio, bands):
+    """Color of the first band the ratio is above, RED when it is above none"""
+    for threshold, color in bands:
+        if ratio > threshold:
+            return color
+    return RED
+
+def _drill_hits(head_x, head_y, xs, ys):
+    """Mask of points inside the drill rectangle below the attacker's head"""
+    drill_left = head_x - DRILL_WIDTH // 2
+    drill_right = head_x + DRILL_WIDTH // 2
+    drill_top = head_y + WORM_RADIUS
+    drill_bottom = head_y + WORM_RADIUS + DRILL_DEPTH
+    return (drill_left <= xs) & (xs <= drill_right) & (drill_top <= ys) & (ys <= drill_bottom)
+
+def _laser_hits(head_x, head_y, target_x, target_y, xs, ys):
+    """Mask of points on the laser line from the head to the target (None for a zero-length beam)"""
+    line_dx = target_x - head_x
+    line_dy = target_y - head_y
+    line_length_sq = line_dx * line_dx + line_dy * line_dy
+    if line_length_sq <= 0:
+        return None
+    line_length = math.sqrt(line_length_sq)
+    
+    # Distance from point to line formula, scaled by line_length (saves a divide per point)
+    scaled_distances = np.abs(line_dy * xs - line_dx * ys + target_x * head_y - target_y * head_x)
+    
+    # Close to the laser line and within laser range
+    dx = xs - head_x
+    dy = ys - head_y
+    return (scaled_distances <= (LASER_WIDTH // 2) * line_length) & (dx * dx + dy * dy <= line_length_sq)
+
+def _torch_hits(head_x, head_y, direction_angle, xs, ys):
+    """Mask of points inside the torch cone facing direction_angle"""
+    angles = np.arctan2(ys - head_y, xs - head_x)
+    
+    # Angle difference normalized to [-pi, pi]
+    angle_diffs = (np.abs(angles - direction_angle) + math.pi) % (2 * math.pi) - math.pi
+    
+    dx = xs - head_x
+    dy = ys - head_y
+    cone_half_angle = math.radians(TORCH_CONE_ANGLE / 2)
+    return (np.abs(angle_diffs) <= cone_half_angle) & (dx * dx + dy * dy <= _TORCH_RANGE_SQ)
 
 class Game:
+    # Pre-rendered wormhole ring and glow frames (shared by all games)
+    wormhole_frames = None
+    wormhole_glow_frames = None
+    
+    @classmethod
+    def _build_wormhole_frames(cls):
+        """Pre-render every wormhole ring at each rotation step of its repeating pattern"""
+        num_rings = _WORMHOLE_NUM_RINGS
+        max_radius = _WORMHOLE_MAX_RADIUS
+        segments = _WORMHOLE_SEGMENTS
+        arc_segments = 8
+        angle_step = 2 * math.pi / segments
+        arc_div = 1.0 / arc_segments
+        
+        # Angles of every arc point of every drawn segment (only every other segment, for spiral effect)
+        arc_step = angle_step * 0.8 * arc_div  # Small gap between segments
+        segment_angles = (np.arange(0, segments, 2)[:, None] * angle_step +
+                          np.arange(arc_segments + 1)[None, :] * arc_step)
+        
+        # Unit-circle table for those angles; each rotation step just rotates it
+        unit_cos = np.cos(segment_angles)
+        unit_sin = np.sin(segment_angles)
+        
+        cls.wormhole_frames = []
+        for ring in range(num_rings):
+            # Calculate ring properties
+            ring_radius = max_radius * (ring + 1) / num_rings
+            ring_alpha = max(50, 255 - ring * 25)  # Fade out towards edges
+            base_color = _WORMHOLE_COLORS[ring % len(_WORMHOLE_COLORS)]
+            color_with_alpha = (*base_color, ring_alpha)  # Alpha for transparency effect
+            inner_radius = ring_radius * 0.7
+            outer_radius = ring_radius
+            
+            # Frames are centered on the wormhole, with a pixel of margin
+            surf_center = int(math.ceil(ring_radius)) + 1
+            ring_frames = []
+            for step in range(_WORMHOLE_ROTATION_STEPS):
+                rotation_angle = step * _WORMHOLE_ROTATION_PERIOD / _WORMHOLE_ROTATION_STEPS
+                frame = pygame.Surface((surf_center * 2, surf_center * 2), pygame.SRCALPHA)
+                
+                # All outer and inner edge points in one pass (rotate the unit table)
+                cos_r = math.cos(rotation_angle)
+                sin_r = math.sin(rotation_angle)
+                cos = unit_cos * cos_r - unit_sin * sin_r
+                sin = unit_cos * sin_r + unit_sin * cos_r
+                outer_xs = (surf_center + cos * outer_radius).tolist()
+                outer_ys = (surf_center + sin * outer_radius).tolist()
+                inner_xs = (surf_center + cos * inner_radius).tolist()
+                inner_ys = (surf_center + sin * inner_radius).tolist()
+                
+                # Outer edge, then inner edge back
+                for k in range(len(segment_angles)):
+                    points = list(zip(outer_xs[k], outer_ys[k])) + list(zip(inner_xs[k][::-1], inner_ys[k][::-1]))
+                    pygame.draw.polygon(frame, color_with_alpha, points)
+                ring_frames.append(frame.convert_alpha())
+            cls.wormhole_frames.append((surf_center, ring_frames))
+        
+        # Center glow at each step of its pulse (radius 10 to 20)
+        cls.wormhole_glow_frames = []
+        for step in range(_WORMHOLE_GLOW_STEPS + 1):
+            glow_radius = 15 + (step * 2 / _WORMHOLE_GLOW_STEPS - 1) * 5
+            glow_surface = pygame.Surface((glow_radius * 4, glow_radius * 4), pygame.SRCALPHA)
+            pygame.draw.circle(glow_surface, (255, 255, 255, 100), (glow_radius * 2, glow_radius * 2), int(glow_radius * 2))
+            pygame.draw.circle(glow_surface, (200, 200, 255, 150), (glow_radius * 2, glow_radius * 2), int(glow_radius * 1.5))
+            pygame.draw.circle(glow_surface, (255, 255, 255, 255), (glow_radius * 2, glow_radius * 2), int(glow_radius))
+            cls.wormhole_glow_frames.append(glow_surface.convert_alpha())
+    
     def __init__(self, screen, config):
         self.screen = screen
         self.config = config
@@ -29,9 +208,32 @@ class Game:
         self.quit_menu_active = False
         self.quit_menu_selection = 0  # 0 for No, 1 for Yes
         
+        # Quit confirmation box and its buttons (fixed screen positions)
+        self._quit_box_rect = pygame.Rect(0, 0, 400, 200)
+        self._quit_box_rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+        self._no_button_rect = pygame.Rect(self._quit_box_rect.x + 70, self._quit_box_rect.y + 120, 120, 50)
+        self._yes_button_rect = pygame.Rect(self._quit_box_rect.x + 210, self._quit_box_rect.y + 120, 120, 50)
+        
         # FPS tracking
-        self.fps_values = []
-        self.fps_update_timer = 0
+        self.fps_values = deque(maxlen=60)  # Last 60 frames
+        self._fps_sum = 0.0  # Running sum of fps_values
+        self._focused = True  # Whether the window has input focus
+        self._fps_label_value = None  # Average FPS (in tenths) the cached label shows
+        self._fps_label = None  # (text surface, text rect, background rect)
+        self.fps_update_timer = 0  # Seconds since the FPS label was last refreshed
+        
+        # Real time not yet simulated in fixed steps
+        self._accumulator = 0.0
+        
+        # UI fonts by point size (created once instead of every frame)
+        self._fonts = {size: pygame.font.Font(None, size) for size in (20, 24, 28, 32, 36, 72)}
+        self._text_cache = OrderedDict()  # Rendered text surfaces keyed by (font_size, text, color), oldest use first
+        
+        # Pause overlay and quit box never change, so build them once
+        self._build_pause_surfaces()
+        
+        # Shared physics pool for every thrown dynamite in flight
+        self.dynamite_pool = DynamitePool()
         
         for i, worm_config in enumerate(config['worms']):
             # Start positions spread across the top with terrain offset
@@ -40,8 +242,7 @@ class Game:
             start_y = int(MAP_HEIGHT * TILE_SIZE * 0.3) + terrain_y_offset  # Account for offset
             
             # Move up until we find empty space
-            while start_y > terrain_y_offset + 50 and self.terrain.is_solid(start_x, start_y):
-                start_y -= TILE_SIZE
+            start_y = self.terrain.surface_y(start_x, start_y, terrain_y_offset + 50)
                 
             worm = Worm(start_x, start_y)
             worm.name = worm_config['name']
@@ -49,10 +250,28 @@ class Game:
             worm.is_human = worm_config['is_human']
             worm.player_id = worm_config['player_id']
             worm.tools_mode = config.get('tools_mode', 'standard')
+            worm.dynamite_pool = self.dynamite_pool
             self.worms.append(worm)
         
+        # Human worms controlled by each keyboard player
+        self._player_worms = {}
+        self._rebuild_player_indexes()
+        
+        # Head positions as a worm-indexed array for vectorized tool hit tests
+        self._worm_pos = np.empty((len(self.worms), 2))
+        
+        # Work for _check_tool_damage gathered during the step
+        self._tool_firers = []  # Worms that used a tool this step
+        self._dynamites_exploded = False  # Whether any thrown dynamite went off
+        
+        # Status panel layout only depends on the number of worms
+        self._build_ui_layout()
+        self._build_ui_background()
+        
         self.goal_pos = (MAP_WIDTH * TILE_SIZE - 100, MAP_HEIGHT * TILE_SIZE + terrain_y_offset - 100)
         self.wormhole_animation_time = 0  # For animating the wormhole
+        if Game.wormhole_frames is None:
+            Game._build_wormhole_frames()
         self.level_complete = False
         
         # Camera follows the current active worm
@@ -71,12 +290,29 @@ class Game:
         battle_minutes = config.get('battle_length_minutes', 5)  # Default to 5 minutes
         self.battle_timer_duration = battle_minutes * 60  # Convert to seconds
         self.battle_timer = self.battle_timer_duration  # Timer in seconds
-        self.battle_timer_start_time = time.time()  # Track when game started
+        self._battle_elapsed = 0.0  # Simulated time played, advanced from dt in update()
         self.timer_flash_state = False  # For flashing effect
         self.timer_flash_timer = 0.0  # Track flash timing
         
+    def handle_events(self, events):
+        """Handle a batch of input events drained in one call"""
+        for event in events:
+            # Skip event types that nothing in the game would act on
+            if event.type in _GAME_EVENT_TYPES:
+                result = self.handle_event(event)
+                if result:
+                    return result
+        
     def handle_event(self, event):
         """Handle input events"""
+        # Track window focus so FPS sampling can skip background frames
+        if event.type == pygame.WINDOWFOCUSLOST:
+            self._focused = False
+            return
+        if event.type == pygame.WINDOWFOCUSGAINED:
+            self._focused = True
+            return
+        
         # Handle pause menu events first
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
@@ -105,49 +341,19 @@ class Game:
         
         # Handle mouse events for quit menu
         if event.type == pygame.MOUSEBUTTONDOWN and self.quit_menu_active:
-            mouse_x, mouse_y = pygame.mouse.get_pos()
-            
-            # Calculate button positions (same as in render method)
-            box_width = 400
-            box_height = 200
-            box_x = (SCREEN_WIDTH - box_width) // 2
-            box_y = (SCREEN_HEIGHT - box_height) // 2
-            button_width = 120
-            button_height = 50
-            button_y = box_y + 120
-            
-            # No button bounds
-            no_x = box_x + 70
-            if no_x <= mouse_x <= no_x + button_width and button_y <= mouse_y <= button_y + button_height:
+            if self._no_button_rect.collidepoint(event.pos):
                 self.quit_menu_active = False
                 self.paused = False
                 return
-            
-            # Yes button bounds  
-            yes_x = box_x + 210
-            if yes_x <= mouse_x <= yes_x + button_width and button_y <= mouse_y <= button_y + button_height:
+            if self._yes_button_rect.collidepoint(event.pos):
                 return "quit_to_menu"
         
         # Handle mouse hover for quit menu
         if event.type == pygame.MOUSEMOTION and self.quit_menu_active:
-            mouse_x, mouse_y = pygame.mouse.get_pos()
-            
-            # Calculate button positions
-            box_width = 400
-            box_height = 200
-            box_x = (SCREEN_WIDTH - box_width) // 2
-            box_y = (SCREEN_HEIGHT - box_height) // 2
-            button_width = 120
-            button_height = 50
-            button_y = box_y + 120
-            
             # Check which button mouse is over
-            no_x = box_x + 70
-            yes_x = box_x + 210
-            
-            if no_x <= mouse_x <= no_x + button_width and button_y <= mouse_y <= button_y + button_height:
+            if self._no_button_rect.collidepoint(event.pos):
                 self.quit_menu_selection = 0  # No button
-            elif yes_x <= mouse_x <= yes_x + button_width and button_y <= mouse_y <= button_y + button_height:
+            elif self._yes_button_rect.collidepoint(event.pos):
                 self.quit_menu_selection = 1  # Yes button
         
         # Don't process game events if paused
@@ -156,19 +362,11 @@ class Game:
         
         # Route events to the appropriate player based on key
         if event.type == pygame.KEYDOWN or event.type == pygame.KEYUP:
-            # Keys that belong to player 1
-            p1_keys = [pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s, pygame.K_f, pygame.K_SPACE, pygame.K_q, pygame.K_e]
-            # Keys that belong to player 2
-            p2_keys = [pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN, pygame.K_RCTRL, pygame.K_COMMA, pygame.K_MINUS, pygame.K_PERIOD]
-
-            if event.key in p1_keys:
-                player1_worms = [w for w in self.worms if w.is_human and w.player_id == 1]
-                if player1_worms:
-                    player1_worms[0].handle_event(event, player_id=1)
-            elif event.key in p2_keys:
-                player2_worms = [w for w in self.worms if w.is_human and w.player_id == 2]
-                if player2_worms:
-                    player2_worms[0].handle_event(event, player_id=2)
+            player_id = _KEY_TO_PLAYER.get(event.key)
+            if player_id:
+                player_worm = self._player_worms.get(player_id)
+                if player_worm:
+                    player_worm.handle_event(event, player_id=player_id)
             else:
                 # If key does not map to a specific player, send to current active human worm
                 current_worm = self.worms[self.current_player]
@@ -180,25 +378,58 @@ class Game:
             if current_worm.is_human:
                 current_worm.handle_event(event)
         
-    def update(self, dt):
-        """Update game state"""
-        # Update FPS tracking
-        if dt > 0:
-            current_fps = 1.0 / dt
+    def _rebuild_player_indexes(self):
+        """Map each keyboard player to the first human worm they control"""
+        self._player_worms = {}
+        for worm in self.worms:
+            if worm.is_human and worm.player_id in (1, 2):
+                self._player_worms.setdefault(worm.player_id, worm)
+    
+    def step(self, real_dt):
+        """Advance the game by a frame's real time in fixed-size update steps"""
+        # Don't update anything (FPS included) while paused
+        if self.paused:
+            return
+        
+        # Update FPS tracking (background frames would skew the average)
+        if real_dt > 0 and self._focused:
+            current_fps = 1.0 / real_dt
+            if len(self.fps_values) == self.fps_values.maxlen:
+                self._fps_sum -= self.fps_values[0]  # Oldest frame is about to be dropped
             self.fps_values.append(current_fps)
-            if len(self.fps_values) > 60:  # Keep last 60 frames
-                self.fps_values.pop(0)
+            self._fps_sum += current_fps
         
-        self.fps_update_timer += dt
+        self.fps_update_timer += real_dt
         
+        # A frame within a millisecond of one step counts as exactly one step, so the
+        # 16/17 ms frames of a 60 FPS clock don't alternate between 0 and 2 steps
+        if abs(real_dt - FIXED_DT) < _STEP_SNAP:
+            real_dt = FIXED_DT
+        
+        # Run as many whole steps as the accumulated time covers
+        self._accumulator += real_dt
+        steps = 0
+        while self._accumulator >= FIXED_DT:
+            if steps == MAX_STEPS_PER_FRAME:
+                # Too far behind to catch up, drop the backlog instead of spiralling
+                self._accumulator = 0.0
+                break
+            self._accumulator -= FIXED_DT
+            steps += 1
+            result = self.update(FIXED_DT)
+            if result:
+                return result
+    
+    def update(self, dt):
+        """Update game state by one simulation step"""
         # Don't update game state if paused
         if self.paused:
             return
-            
+        
         # Update battle timer if enabled
         if self.battle_timer_enabled:
-            elapsed_time = time.time() - self.battle_timer_start_time
-            self.battle_timer = max(0, self.battle_timer_duration - elapsed_time)
+            self._battle_elapsed += dt
+            self.battle_timer = max(0, self.battle_timer_duration - self._battle_elapsed)
             
             # Update flash timer for warning effect
             if self.battle_timer <= BATTLE_TIMER_WARNING_TIME:
@@ -221,6 +452,11 @@ class Game:
             # Handle any death from fall damage
             if death_info and isinstance(death_info, dict) and death_info.get('needs_death_handling'):
                 self._handle_worm_death(worm, death_info.get('damage', 0), death_info.get('killer'))
+            if worm.tool_used_this_frame:
+                self._tool_firers.append(worm)
+        
+        # Update thrown dynamites
+        self._update_dynamites(dt)
             
         # Check for tool damage between worms
         self._check_tool_damage()
@@ -234,19 +470,39 @@ class Game:
         # Update tombstones
         self._update_tombstones(dt)
         
-        # Check if any worm reached goal
-        for worm in self.worms:
-            worm_pos = worm.get_position()
-            goal_distance = ((worm_pos[0] - self.goal_pos[0])**2 + (worm_pos[1] - self.goal_pos[1])**2)**0.5
-            if goal_distance < 50 and not self.level_complete:
-                self.level_complete = True
-                self._next_level()
-                break
+        # Check if any worm reached goal (box test first, then squared distance)
+        if not self.level_complete:
+            goal_x, goal_y = self.goal_pos
+            for worm in self.worms:
+                dx = worm.x - goal_x
+                dy = worm.y - goal_y
+                if (-_GOAL_RADIUS < dx < _GOAL_RADIUS and -_GOAL_RADIUS < dy < _GOAL_RADIUS
+                        and dx * dx + dy * dy < _GOAL_RADIUS_SQ):
+                    self.level_complete = True
+                    self._next_level()
+                    break
             
     def _check_tool_damage(self):
         """Check if any worms are damaged by tools used by other worms"""
-        for attacker in self.worms:
-            if attacker.is_dead or not attacker.tool_used_this_frame:
+        # Most steps nobody uses a tool and no dynamite goes off
+        if self._tool_firers:
+            self._check_tool_hits()
+            self._tool_firers.clear()
+        if self._dynamites_exploded:
+            self._check_dynamite_explosions()
+            self._dynamites_exploded = False
+    
+    def _check_tool_hits(self):
+        """Damage worms caught by the drill, laser or torch of a worm that used one this step"""
+        # Head positions of every worm as arrays (worms have moved this step)
+        worm_pos = self._worm_pos
+        for i, worm in enumerate(self.worms):
+            worm_pos[i] = worm.body_segments[0]
+        victim_xs = worm_pos[:, 0]
+        victim_ys = worm_pos[:, 1]
+        
+        for attacker in self._tool_firers:
+            if attacker.is_dead:
                 continue
                 
             tool_info = attacker.tool_used_this_frame
@@ -255,98 +511,102 @@ class Game:
             target_y = tool_info['target_y']
             head_x, head_y = tool_info['attacker_pos']
             
-            # Check damage to other worms based on tool type
-            for victim in self.worms:
+            # Check which worms are in the tool's damage area (all at once)
+            if tool == "drill":
+                hit = _drill_hits(head_x, head_y, victim_xs, victim_ys)
+                damage = DRILL_DAMAGE
+            elif tool == "laser":
+                hit = _laser_hits(head_x, head_y, target_x, target_y, victim_xs, victim_ys)
+                if hit is None:
+                    continue
+                damage = LASER_DAMAGE
+            elif tool == "torch":
+                if 'direction_angle' not in tool_info:
+                    continue
+                hit = _torch_hits(head_x, head_y, tool_info['direction_angle'], victim_xs, victim_ys)
+                damage = TORCH_DAMAGE
+            else:
+                continue
+            
+            # Apply damage to the worms that were hit
+            for i in np.flatnonzero(hit).tolist():
+                victim = self.worms[i]
                 if victim == attacker or victim.is_dead:
                     continue
-                    
-                victim_x, victim_y = victim.body_segments[0]
-                
-                # Check if victim is in tool's damage area
-                if tool == "drill":
-                    # Drill: Check if victim is in drill rectangle below attacker
-                    drill_left = head_x - DRILL_WIDTH // 2
-                    drill_right = head_x + DRILL_WIDTH // 2
-                    drill_top = head_y + WORM_RADIUS
-                    drill_bottom = head_y + WORM_RADIUS + DRILL_DEPTH
-                    
-                    if (drill_left <= victim_x <= drill_right and 
-                        drill_top <= victim_y <= drill_bottom):
-                        damage_result = victim.take_damage(DRILL_DAMAGE, attacker)
-                        if damage_result and isinstance(damage_result, dict) and damage_result.get('needs_death_handling'):
-                            self._handle_worm_death(victim, DRILL_DAMAGE, attacker)
-                        
-                elif tool == "laser":
-                    # Laser: Check if victim is on the laser line
-                    # Calculate distance from victim to laser line
-                    # Line from (head_x, head_y) to (target_x, target_y)
-                    line_length = math.sqrt((target_x - head_x)**2 + (target_y - head_y)**2)
-                    if line_length > 0:
-                        # Distance from point to line formula
-                        distance = abs((target_y - head_y) * victim_x - (target_x - head_x) * victim_y + 
-                                     target_x * head_y - target_y * head_x) / line_length
-                        
-                        # Check if victim is close to laser line and within laser range
-                        victim_distance_from_start = math.sqrt((victim_x - head_x)**2 + (victim_y - head_y)**2)
-                        if distance <= LASER_WIDTH // 2 and victim_distance_from_start <= line_length:
-                            damage_result = victim.take_damage(LASER_DAMAGE, attacker)
-                            if damage_result and isinstance(damage_result, dict) and damage_result.get('needs_death_handling'):
-                                self._handle_worm_death(victim, LASER_DAMAGE, attacker)
-                            
-                elif tool == "torch":
-                    # Torch: Check if victim is in torch cone
-                    if 'direction_angle' in tool_info:
-                        direction_angle = tool_info['direction_angle']
-                        
-                        # Calculate angle from attacker to victim
-                        victim_angle = math.atan2(victim_y - head_y, victim_x - head_x)
-                        
-                        # Check if victim is within torch cone
-                        angle_diff = abs(victim_angle - direction_angle)
-                        # Normalize angle difference to [-pi, pi]
-                        while angle_diff > math.pi:
-                            angle_diff -= 2 * math.pi
-                        while angle_diff < -math.pi:
-                            angle_diff += 2 * math.pi
-                            
-                        victim_distance = math.sqrt((victim_x - head_x)**2 + (victim_y - head_y)**2)
-                        cone_half_angle = math.radians(TORCH_CONE_ANGLE / 2)
-                        
-                        if abs(angle_diff) <= cone_half_angle and victim_distance <= TORCH_RANGE:
-                            damage_result = victim.take_damage(TORCH_DAMAGE, attacker)
-                            if damage_result and isinstance(damage_result, dict) and damage_result.get('needs_death_handling'):
-                                self._handle_worm_death(victim, TORCH_DAMAGE, attacker)
-        
-        # Check dynamite explosions
+                damage_result = victim.take_damage(damage, attacker)
+                if damage_result and isinstance(damage_result, dict) and damage_result.get('needs_death_handling'):
+                    self._handle_worm_death(victim, damage, attacker)
+        
+    def _check_dynamite_explosions(self):
+        """Turn exploded dynamites into explosions and apply their damage"""
+        new_explosions = []
         for worm in self.worms:
             if worm.is_dead:
                 continue
                 
-            # Check for exploded dynamites and create explosions
-            for dynamite in worm.thrown_dynamites[:]:  # Copy list to safely modify
-                if hasattr(dynamite, 'exploded_this_frame') and dynamite.exploded_this_frame:
+            # Check for exploded dynamites and create explosions (backwards, so swap-and-pop is safe)
+            thrown_dynamites = worm.thrown_dynamites
+            for i in range(len(thrown_dynamites) - 1, -1, -1):
+                dynamite = thrown_dynamites[i]
+                if dynamite.exploded_this_frame:
                     explosion_x, explosion_y = dynamite.get_position()
                     
                     # Remove the exploded dynamite
-                    worm.thrown_dynamites.remove(dynamite)
-                    
-                    # Create explosion animation and handle damage
-                    explosion = ExplosionPresets.dynamite_explosion(explosion_x, explosion_y, worm)
-                    damaged_worms = explosion.apply_damage(self.worms)
-                    
-                    # Handle any deaths from explosion
-                    for damaged_worm, damage, distance, needs_death_handling, damage_result in damaged_worms:
-                        if needs_death_handling:
-                            self._handle_worm_death(damaged_worm, damage, worm)
+                    thrown_dynamites[i] = thrown_dynamites[-1]
+                    thrown_dynamites.pop()
                     
+                    # Create explosion animation (damage for all of them is applied below)
+                    explosion = dynamite_explosion(explosion_x, explosion_y, worm)
+                    new_explosions.append(explosion)
                     self.active_explosions.append(explosion)
+        
+        if new_explosions:
+            self._apply_explosion_damage(new_explosions)
+    
+    def _apply_explosion_damage(self, explosions):
+        """Damage the worms in range of each explosion, with every distance computed in one pass"""
+        # Head positions of every worm as arrays (tool hits may have relocated some)
+        worm_pos = self._worm_pos
+        for i, worm in enumerate(self.worms):
+            worm_pos[i] = worm.body_segments[0]
+        
+        # Squared distance from every explosion center to every worm head
+        blasts = np.array([(explosion.x, explosion.y, explosion.radius) for explosion in explosions])
+        dx = worm_pos[:, 0] - blasts[:, 0, None]
+        dy = worm_pos[:, 1] - blasts[:, 1, None]
+        distances_sq = dx * dx + dy * dy
+        in_range = distances_sq <= (blasts[:, 2] * blasts[:, 2])[:, None]
+        
+        # Apply explosion by explosion, so a worm killed by one is already respawning for the next
+        for e, i in zip(*np.nonzero(in_range)):
+            victim = self.worms[i]
+            if victim.is_dead:
+                continue
+            explosion = explosions[e]
+            
+            # Calculate damage based on distance (closer = more damage)
+            distance = math.sqrt(distances_sq[e, i])
+            damage = max(EXPLOSION_MIN_DAMAGE, explosion.base_damage - int(distance))
+            damage_result = victim.take_damage(damage, explosion.source_worm)
+            if damage_result and isinstance(damage_result, dict) and damage_result.get('needs_death_handling'):
+                self._handle_worm_death(victim, damage, explosion.source_worm)
+    
+    def _update_dynamites(self, dt):
+        """Advance all thrown dynamites and dig craters for the ones that exploded"""
+        for dynamite in self.dynamite_pool.step(dt, self.terrain):
+            # Don't remove yet (damage check will handle removal)
+            self._dynamites_exploded = True
+            dyn_x, dyn_y = dynamite.get_position()
+            self.terrain.dig(dyn_x, dyn_y, DYNAMITE_RADIUS, "dynamite")
     
     def _update_explosions(self, dt):
         """Update all active explosions"""
-        for explosion in self.active_explosions[:]:  # Copy list to safely modify
-            if not explosion.update(dt):
+        explosions = self.active_explosions
+        for i in range(len(explosions) - 1, -1, -1):  # Backwards, so swap-and-pop is safe
+            if not explosions[i].update(dt):
                 # Explosion finished, remove it
-                self.active_explosions.remove(explosion)
+                explosions[i] = explosions[-1]
+                explosions.pop()
     
     def create_explosion(self, x, y, radius, damage, source_worm=None):
         """Create an explosion at the specified location"""
@@ -398,43 +658,44 @@ class Game:
     def _find_safe_spawn_location(self, respawning_worm):
         """Find a safe location to spawn away from other worms"""
         # Try to spawn near the top of the map, but not too close to other worms
-        attempts = 0
         max_attempts = 20
         
-        while attempts < max_attempts:
-            # Random X position across the map
-            spawn_x = random.uniform(WORM_RADIUS + 50, SCREEN_WIDTH - WORM_RADIUS - 50)
-            # Spawn in upper portion of the map
-            spawn_y = random.uniform(UI_HEIGHT + 100, UI_HEIGHT + 300)
-            
-            # Check distance from other living worms
-            safe = True
-            for other_worm in self.worms:
-                if other_worm != respawning_worm and not other_worm.is_dead:
-                    other_x, other_y = other_worm.body_segments[0]
-                    distance = math.sqrt((spawn_x - other_x)**2 + (spawn_y - other_y)**2)
-                    if distance < MIN_SPAWN_DISTANCE:
-                        safe = False
-                        break
-                        
-            # Check if spawn location is not inside terrain
-            if safe and not self.terrain.is_solid(spawn_x, spawn_y):
-                # Find ground level below spawn point
-                ground_y = spawn_y
-                while ground_y < SCREEN_HEIGHT - 50 and not self.terrain.is_solid(spawn_x, ground_y):
-                    ground_y += 5
-                    
-                # Spawn a bit above ground
-                return spawn_x, max(spawn_y, ground_y - WORM_RADIUS - 10)
-                
-            attempts += 1
+        # Random positions across the map, in the upper portion, all drawn at once
+        spawn_xs = np.random.uniform(WORM_RADIUS + 50, SCREEN_WIDTH - WORM_RADIUS - 50, max_attempts)
+        spawn_ys = np.random.uniform(UI_HEIGHT + 100, UI_HEIGHT + 300, max_attempts)
+        
+        # Check distance from other living worms for every candidate in one pass
+        others = [other_worm.body_segments[0] for other_worm in self.worms
+                  if other_worm is not respawning_worm and not other_worm.is_dead]
+        if others:
+            others = np.array(others, dtype=float)
+            dx = spawn_xs[:, None] - others[:, 0]
+            dy = spawn_ys[:, None] - others[:, 1]
+            safe = (dx * dx + dy * dy).min(axis=1) >= _MIN_SPAWN_DISTANCE_SQ
+        else:
+            safe = np.ones(max_attempts, dtype=bool)
+        
+        # Check the safe candidates are not inside terrain; take the first that passes
+        candidates = np.flatnonzero(safe)
+        open_spots = candidates[~self.terrain.is_solid_batch(spawn_xs[candidates], spawn_ys[candidates])]
+        if len(open_spots):
+            spawn_x = float(spawn_xs[open_spots[0]])
+            spawn_y = float(spawn_ys[open_spots[0]])
+            
+            # Find ground level below spawn point
+            ground_y = self.terrain.ground_y(spawn_x, spawn_y, SCREEN_HEIGHT - 50, 5)
+            
+            # Spawn a bit above ground
+            return spawn_x, max(spawn_y, ground_y - WORM_RADIUS - 10)
             
         # Fallback: spawn at default location if no safe spot found
         return 200, UI_HEIGHT + 150
         
     def _update_tombstones(self, dt):
         """Update tombstone animations and handle looting"""
-        for tombstone in self.tombstones[:]:  # Copy list to safely modify
+        tombstones = self.tombstones
+        for i in range(len(tombstones) - 1, -1, -1):  # Backwards, so swap-and-pop is safe
+            tombstone = tombstones[i]
             tombstone.update(dt)
             
             # Check if any living worm can loot this tombstone
@@ -443,7 +704,8 @@ class Game:
                     # For now, auto-loot when near. Later we can add key press requirement
                     if tombstone.loot(worm):
                         # Tombstone was successfully looted, remove it
-                        self.tombstones.remove(tombstone)
+                        tombstones[i] = tombstones[-1]
+                        tombstones.pop()
                         break
     
     def _next_level(self):
@@ -453,14 +715,16 @@ class Game:
         # Generate new terrain
         self.terrain = Terrain(MAP_WIDTH, MAP_HEIGHT)
         
+        # Dynamites in flight belong to the old level
+        self.dynamite_pool.clear()
+        
         # Reset all worms but keep their gas
         for i, worm in enumerate(self.worms):
             terrain_y_offset = UI_HEIGHT
             start_x = 100 + i * 300  # Spread worms wider for bigger map
             # Find a safe spot on the surface for new level
             start_y = int(MAP_HEIGHT * TILE_SIZE * 0.3) + terrain_y_offset
-            while start_y > terrain_y_offset + 50 and self.terrain.is_solid(start_x, start_y):
-                start_y -= TILE_SIZE
+            start_y = self.terrain.surface_y(start_x, start_y, terrain_y_offset + 50)
             
             # Preserve properties
             worm_gas = worm.gas
@@ -480,9 +744,16 @@ class Game:
             new_worm.color = worm_color
             new_worm.is_human = worm_is_human
             new_worm.player_id = worm_player_id
+            new_worm.dynamite_pool = self.dynamite_pool
             
             self.worms[i] = new_worm
         
+        # Worm objects were replaced, so refresh the per-player lists
+        self._rebuild_player_indexes()
+        
+        # Level label changed
+        self._build_ui_background()
+        
         # Reset level completion flag
         self.level_complete = False
             
@@ -508,10 +779,15 @@ class Game:
         for explosion in self.active_explosions:
             explosion.render(self.screen, camera_x, camera_y)
             
-        # Render thrown dynamites for each worm
+        # Render thrown dynamites for each worm in a single batched blit
+        dynamite_blits = []
         for worm in self.worms:
             for dynamite in worm.thrown_dynamites:
-                dynamite.render(self.screen, camera_x, camera_y)
+                blit = dynamite.get_blit(camera_x, camera_y)
+                if blit:
+                    dynamite_blits.append(blit)
+        if dynamite_blits:
+            self.screen.blits(dynamite_blits, doreturn=False)
                 
         # Render tombstones
         for tombstone in self.tombstones:
@@ -533,335 +809,339 @@ class Game:
         screen_x = center_x - camera_x
         screen_y = center_y - camera_y
         
-        # Only render if visible on screen
-        if -100 <= screen_x <= SCREEN_WIDTH + 100 and -100 <= screen_y <= SCREEN_HEIGHT + 100:
-            # Wormhole consists of multiple rotating rings
-            num_rings = 8
-            max_radius = 60
-            
-            for ring in range(num_rings):
-                # Calculate ring properties
-                ring_radius = max_radius * (ring + 1) / num_rings
-                ring_alpha = max(50, 255 - ring * 25)  # Fade out towards edges
-                
-                # Rotation speed varies for each ring (creates spiral effect)
-                rotation_speed = 2.0 + ring * 0.3
-                rotation_angle = self.wormhole_animation_time * rotation_speed
-            
-            # Create swirling colors (purple to blue to white)
-            base_colors = [
-                (75, 0, 130),    # Indigo
-                (138, 43, 226),  # Blue Violet  
-                (0, 191, 255),   # Deep Sky Blue
-                (255, 255, 255)  # White (center)
-            ]
-            
-            color_index = ring % len(base_colors)
-            base_color = base_colors[color_index]
-            
-            # Draw ring segments for swirling effect
-            segments = 12
-            for segment in range(segments):
-                segment_angle = (segment * 2 * math.pi / segments) + rotation_angle
-                
-                # Calculate segment positions
-                inner_radius = ring_radius * 0.7
-                outer_radius = ring_radius
-                
-                # Create segment points
-                angle1 = segment_angle
-                angle2 = segment_angle + (2 * math.pi / segments) * 0.8  # Small gap between segments
-                
-                # Only draw every other segment for spiral effect
-                if segment % 2 == 0:
-                    # Draw arc segments
-                    start_angle = angle1
-                    end_angle = angle2
-                    
-                    # Create a surface for the ring segment with alpha
-                    ring_surface = pygame.Surface((max_radius * 2, max_radius * 2), pygame.SRCALPHA)
-                    
-                    # Draw the ring segment
-                    points = []
-                    arc_segments = 8
-                    for i in range(arc_segments + 1):
-                        angle = start_angle + (end_angle - start_angle) * i / arc_segments
-                        # Outer edge (use screen coordinates)
-                        x = screen_x + math.cos(angle) * outer_radius
-                        y = screen_y + math.sin(angle) * outer_radius
-                        points.append((x, y))
-                    
-                    for i in range(arc_segments, -1, -1):
-                        angle = start_angle + (end_angle - start_angle) * i / arc_segments
-                        # Inner edge (use screen coordinates)
-                        x = screen_x + math.cos(angle) * inner_radius
-                        y = screen_y + math.sin(angle) * inner_radius
-                        points.append((x, y))
-                    
-                    if len(points) > 2:
-                        # Create color with alpha for transparency effect
-                        color_with_alpha = (*base_color, ring_alpha)
-                        
-                        # Create a temporary surface to draw the polygon with alpha
-                        temp_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                        pygame.draw.polygon(temp_surface, color_with_alpha, points)
-                        self.screen.blit(temp_surface, (0, 0))
-        
-            # Draw center glow
-            glow_radius = 15 + math.sin(self.wormhole_animation_time * 4) * 5
-            glow_color = (255, 255, 255, 200)
-            
-            # Create glowing center
-            glow_surface = pygame.Surface((glow_radius * 4, glow_radius * 4), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surface, (255, 255, 255, 100), (glow_radius * 2, glow_radius * 2), int(glow_radius * 2))
-            pygame.draw.circle(glow_surface, (200, 200, 255, 150), (glow_radius * 2, glow_radius * 2), int(glow_radius * 1.5))
-            pygame.draw.circle(glow_surface, (255, 255, 255, 255), (glow_radius * 2, glow_radius * 2), int(glow_radius))
-            
-            # Position the glow at the center (using screen coordinates)
-            glow_rect = glow_surface.get_rect(center=(screen_x, screen_y))
-            self.screen.blit(glow_surface, glow_rect)
+        # Skip everything when the wormhole and its sparkles are off screen
+        extent = _WORMHOLE_EXTENT
+        if not (-extent <= screen_x <= SCREEN_WIDTH + extent and -extent <= screen_y <= SCREEN_HEIGHT + extent):
+            return
+        
+        # Wormhole consists of multiple rotating rings, drawn in one blits() call with the glow
+        num_rings = _WORMHOLE_NUM_RINGS
+        wormhole_blits = []
+        
+        for ring in range(num_rings):
+            # Rotation speed varies for each ring (creates spiral effect)
+            rotation_speed = 2.0 + ring * 0.3
+            rotation_angle = self.wormhole_animation_time * rotation_speed
             
-            # Add sparkle effects around the wormhole
-            self._render_wormhole_sparkles(camera_x, camera_y)
+            # Pre-rendered ring at the nearest rotation step
+            surf_center, ring_frames = Game.wormhole_frames[ring]
+            step = int(rotation_angle / _WORMHOLE_ROTATION_PERIOD * _WORMHOLE_ROTATION_STEPS) % _WORMHOLE_ROTATION_STEPS
+            wormhole_blits.append((ring_frames[step], (screen_x - surf_center, screen_y - surf_center)))
+        
+        # Center glow (pre-rendered at this pulse step)
+        glow_step = int((math.sin(self.wormhole_animation_time * 4) + 1) * (_WORMHOLE_GLOW_STEPS / 2))
+        glow_surface = Game.wormhole_glow_frames[glow_step]
+        
+        # Position the glow at the center (using screen coordinates)
+        glow_rect = glow_surface.get_rect(center=(screen_x, screen_y))
+        wormhole_blits.append((glow_surface, glow_rect))
+        self.screen.blits(wormhole_blits, doreturn=False)
+        
+        # Add sparkle effects around the wormhole
+        self._render_wormhole_sparkles(camera_x, camera_y)
         
     def _render_wormhole_sparkles(self, camera_x=0, camera_y=0):
         """Add sparkle effects around the wormhole"""
         center_x, center_y = self.goal_pos
-        sparkle_count = 12
         
-        for i in range(sparkle_count):
-            # Each sparkle has its own animation offset
-            sparkle_time = self.wormhole_animation_time + i * 0.5
-            
-            # Position sparkles in a wider area around the wormhole
-            angle = (i * 2 * math.pi / sparkle_count) + sparkle_time * 0.5
-            distance = 70 + math.sin(sparkle_time * 2) * 20
-            
-            world_x = center_x + math.cos(angle) * distance
-            world_y = center_y + math.sin(angle) * distance
-            
-            # Convert to screen coordinates
-            sparkle_x = world_x - camera_x
-            sparkle_y = world_y - camera_y
-            
+        # Every sparkle's position, size and brightness from a single sin kernel
+        orbit_cos, orbit_sin, distance_wave, size_wave, brightness_wave = np.sin(
+            _SPARKLE_WAVE_FREQS * self.wormhole_animation_time + _SPARKLE_WAVE_PHASES)
+        
+        # Position sparkles in a wider area around the wormhole
+        distances = 70 + distance_wave * 20
+        
+        # Convert to screen coordinates
+        sparkle_xs = center_x + orbit_cos * distances - camera_x
+        sparkle_ys = center_y + orbit_sin * distances - camera_y
+        
+        # Sparkle size and brightness variation
+        sparkle_sizes = 2 + size_wave * 1
+        brightnesses = (150 + brightness_wave * 105).astype(int)
+        
+        sparkles = zip(sparkle_xs.tolist(), sparkle_ys.tolist(), sparkle_sizes.tolist(), brightnesses.tolist())
+        for sparkle_x, sparkle_y, sparkle_size, brightness in sparkles:
             # Only render if on screen
             if 0 <= sparkle_x <= SCREEN_WIDTH and 0 <= sparkle_y <= SCREEN_HEIGHT:
-                # Sparkle size and brightness variation
-                sparkle_size = 2 + math.sin(sparkle_time * 3) * 1
-                brightness = int(150 + math.sin(sparkle_time * 4) * 105)
+                sparkle_x = int(sparkle_x)
+                sparkle_y = int(sparkle_y)
+                radius = int(sparkle_size)
+                has_center = sparkle_size > 1
                 
-                # Draw sparkle
-                sparkle_color = (brightness, brightness, 255)
-                pygame.draw.circle(self.screen, sparkle_color, (int(sparkle_x), int(sparkle_y)), int(sparkle_size))
+                # Draw sparkle (a radius-1 circle is the same 2x2 block the center covers)
+                if radius > 1 or not has_center:
+                    sparkle_color = (brightness, brightness, 255)
+                    pygame.draw.circle(self.screen, sparkle_color, (sparkle_x, sparkle_y), radius)
                 
-                # Add a smaller white center
-                if sparkle_size > 1:
-                    pygame.draw.circle(self.screen, WHITE, (int(sparkle_x), int(sparkle_y)), 1)
+                # Add a smaller white center (what a radius-1 circle draws, as a plain fill)
+                if has_center:
+                    self.screen.fill(WHITE, (sparkle_x - 1, sparkle_y - 1, 2, 2))
         
-    def _render_ui(self):
-        """Render user interface elements"""
-        font = pygame.font.Font(None, 28)
-        small_font = pygame.font.Font(None, 24)
-        tiny_font = pygame.font.Font(None, 20)
-        
-        # Draw light gray background for the top UI area
-        ui_background_color = (180, 180, 180)  # Light gray
-        pygame.draw.rect(self.screen, ui_background_color, (0, 0, SCREEN_WIDTH, UI_HEIGHT))
-        
-        # Player status bars at the top horizontally
+    def _text(self, font_size, text, color):
+        """Render text with a cached UI font, reusing the surface while the text is unchanged"""
+        key = (font_size, text, color)
+        text_cache = self._text_cache
+        surface = text_cache.get(key)
+        if surface is None:
+            if len(text_cache) >= _TEXT_CACHE_SIZE:
+                text_cache.popitem(last=False)  # Evict the least recently used label (e.g. an old timer value)
+            surface = self._fonts[font_size].render(text, True, color)
+            text_cache[key] = surface
+        else:
+            text_cache.move_to_end(key)
+        return surface
+    
+    def _build_ui_layout(self):
+        """Precompute text positions and bar rects of every worm's status panel"""
         player_width = SCREEN_WIDTH // (len(self.worms) + 1)  # Make space tighter by adding 1
-        for i, worm in enumerate(self.worms):
+        bar_width = min(120, player_width - 20)
+        bar_height = 8
+        
+        self._ui_layout = []
+        for i in range(len(self.worms)):
             x_start = i * player_width + 10
             y_start = 10
-            
-            # Player name with color indicator (fluctuates during respawn/protection)
+            hp_y = y_start + 25
+            gas_y = hp_y + 30
+            battery_y = gas_y + 30
+            self._ui_layout.append({
+                'bar_width': bar_width,
+                'name': (x_start, y_start),
+                'hp_text': (x_start, hp_y),
+                'hp_bar': pygame.Rect(x_start, hp_y + 12, bar_width, bar_height),
+                'hp_fill': pygame.Rect(x_start, hp_y + 12, bar_width, bar_height),  # Width set per frame
+                'gas_text': (x_start, gas_y),
+                'gas_bar': pygame.Rect(x_start, gas_y + 12, bar_width, bar_height),
+                'gas_fill': pygame.Rect(x_start, gas_y + 12, bar_width, bar_height),
+                'battery_text': (x_start, battery_y),
+                'battery_bar': pygame.Rect(x_start, battery_y + 12, bar_width, bar_height),
+                'battery_fill': pygame.Rect(x_start, battery_y + 12, bar_width, bar_height),
+                'dynamite_text': (x_start, battery_y + 30),
+                'kd_text': (x_start, battery_y + 45),
+                'unlimited_kd_text': (x_start, gas_y + 20),
+            })
+    
+    def _build_ui_background(self):
+        """Pre-render the static parts of the top UI for the current level"""
+        # Light gray background for the top UI area
+        self._ui_bg = pygame.Surface((SCREEN_WIDTH, UI_HEIGHT)).convert()
+        self._ui_bg.fill((180, 180, 180))
+        
+        # Background bars (gas and laser only shown in standard mode)
+        for worm, layout in zip(self.worms, self._ui_layout):
+            self._ui_bg.fill(GRAY, layout['hp_bar'])
+            if worm.tools_mode == 'standard':
+                self._ui_bg.fill(GRAY, layout['gas_bar'])
+                self._ui_bg.fill(GRAY, layout['battery_bar'])
+        
+        # Level indicator at top right
+        level_text = self._text(28, f"LEVEL {self.level}", BLACK)
+        level_rect = level_text.get_rect(right=SCREEN_WIDTH-20, y=15)
+        self._ui_bg.blit(level_text, level_rect)
+        
+        # Panel with the stats drawn on, redrawn when a shown value changes
+        self._ui_surface = self._ui_bg.copy()
+        self._ui_state = None
+    
+    def _render_ui(self):
+        """Render user interface elements, redrawing the panel only when a shown value changed"""
+        # Battle timer as displayed (whole seconds and color)
+        timer_state = None
+        if self.battle_timer_enabled:
+            if self.battle_timer <= BATTLE_TIMER_WARNING_TIME:
+                timer_color = RED if self.timer_flash_state else WHITE
+            else:
+                timer_color = BLACK
+            timer_state = (int(self.battle_timer // 60), int(self.battle_timer % 60), timer_color)
+        
+        # Every worm value the panel shows
+        ui_state = [timer_state]
+        for worm, layout in zip(self.worms, self._ui_layout):
+            # Player name color (fluctuates during respawn/protection like the worm body)
             if worm.is_respawning or worm.spawn_protection > 0:
-                # Use the same fluctuating colors as the worm body
                 name_color = worm.get_render_color()
             else:
-                name_color = worm.color if hasattr(worm, 'color') else BLACK
-            name_text = font.render(worm.name, True, name_color)
-            self.screen.blit(name_text, (x_start, y_start))
+                name_color = worm.color
+            
+            # Laser readout as shown (cooldown in tenths of a second or whole percent, bar pixels,
+            # bar color), so the panel isn't redrawn every frame while it counts or recharges
+            laser_battery, laser_cooldown = worm.laser_battery, worm.laser_cooldown_timer
+            battery_ratio = laser_battery / 100.0
+            battery_width = int(layout['bar_width'] * battery_ratio)
+            if laser_cooldown > 0:
+                laser_shown = (True, round(laser_cooldown, 1), battery_width, RED)  # Red when in cooldown
+            else:
+                laser_shown = (False, int(laser_battery), battery_width,
+                               _band_color(battery_ratio, _BATTERY_BANDS))
+            
+            ui_state.append((name_color, worm.hp, worm.max_hp, worm.gas, laser_shown,
+                             worm.dynamite_count, worm.kills, worm.deaths))
+        
+        if ui_state != self._ui_state:
+            self._ui_state = ui_state
+            self._draw_ui_panel(ui_state)
+        self.screen.blit(self._ui_surface, (0, 0))
+    
+    def _draw_ui_panel(self, ui_state):
+        """Draw the top UI panel for the given shown values into the cached panel surface"""
+        panel = self._ui_surface
+        
+        # Panel, background bars and level label
+        panel.blit(self._ui_bg, (0, 0))
+        
+        # Player status labels go out in one blits() call, then the bar fills on top
+        label_blits = []
+        bar_fills = []
+        
+        # Player status bars at the top horizontally (bar fills are plain rect fills)
+        for worm, layout, worm_state in zip(self.worms, self._ui_layout, ui_state[1:]):
+            name_color, hp, max_hp, gas, laser_shown, dynamite_count, kills, deaths = worm_state
+            
+            # Player name with color indicator
+            name_text = self._text(28, worm.name, name_color)
+            label_blits.append((name_text, layout['name']))
             
             # === HEALTH SECTION ===
-            hp_y = y_start + 25
-            bar_width = min(120, player_width - 20)
-            bar_height = 8
+            bar_width = layout['bar_width']
             
             # HP text above bar
-            hp_text = tiny_font.render(f"HP: {worm.hp}/{worm.max_hp}", True, BLACK)
-            self.screen.blit(hp_text, (x_start, hp_y))
-            
-            # HP background bar
-            pygame.draw.rect(self.screen, GRAY, (x_start, hp_y + 12, bar_width, bar_height))
+            hp_text = self._text(20, f"HP: {hp}/{max_hp}", BLACK)
+            label_blits.append((hp_text, layout['hp_text']))
             
             # HP level bar
-            hp_ratio = worm.hp / worm.max_hp
-            hp_bar_width = int(bar_width * hp_ratio)
-            if hp_ratio > 0.6:
-                hp_color = GREEN
-            elif hp_ratio > 0.3:
-                hp_color = YELLOW
-            else:
-                hp_color = RED
-            pygame.draw.rect(self.screen, hp_color, (x_start, hp_y + 12, hp_bar_width, bar_height))
+            hp_ratio = hp / max_hp
+            hp_fill = layout['hp_fill']
+            hp_fill.width = int(bar_width * hp_ratio)
+            bar_fills.append((_band_color(hp_ratio, _HP_BANDS), hp_fill))
             
             # === GAS SECTION ===
-            gas_y = hp_y + 30
-            
             # Only show weapon stats in standard mode
-            if getattr(worm, 'tools_mode', 'standard') == 'standard':
+            if worm.tools_mode == 'standard':
                 # Gas text above bar
-                gas_text = tiny_font.render(f"GAS: {worm.gas}/{MAX_GAS}", True, BLACK)
-                self.screen.blit(gas_text, (x_start, gas_y))
-                
-                # Gas background bar
-                pygame.draw.rect(self.screen, GRAY, (x_start, gas_y + 12, bar_width, bar_height))
+                gas_text = self._text(20, f"GAS: {gas}/{MAX_GAS}", BLACK)
+                label_blits.append((gas_text, layout['gas_text']))
                 
                 # Gas level bar
-                gas_ratio = worm.gas / MAX_GAS
-                gas_bar_width = int(bar_width * gas_ratio)
-                gas_color = GREEN if gas_ratio > 0.3 else (YELLOW if gas_ratio > 0.1 else RED)
-                pygame.draw.rect(self.screen, gas_color, (x_start, gas_y + 12, gas_bar_width, bar_height))
+                gas_ratio = gas / MAX_GAS
+                gas_fill = layout['gas_fill']
+                gas_fill.width = int(bar_width * gas_ratio)
+                bar_fills.append((_band_color(gas_ratio, _GAS_BANDS), gas_fill))
                 
                 # === LASER SECTION ===
-                battery_y = gas_y + 30
-                
                 # Battery text above bar with cooldown indicator
-                if worm.laser_cooldown_timer > 0:
-                    battery_text = tiny_font.render(f"LASER: COOLDOWN {worm.laser_cooldown_timer:.1f}s", True, BLACK)
+                in_cooldown, laser_value, battery_width, battery_color = laser_shown
+                if in_cooldown:
+                    battery_text = self._text(20, f"LASER: COOLDOWN {laser_value:.1f}s", BLACK)
                 else:
-                    battery_text = tiny_font.render(f"LASER: {int(worm.laser_battery)}%", True, BLACK)
-                self.screen.blit(battery_text, (x_start, battery_y))
-                
-                # Laser background bar
-                pygame.draw.rect(self.screen, GRAY, (x_start, battery_y + 12, bar_width, bar_height))
+                    battery_text = self._text(20, f"LASER: {laser_value}%", BLACK)
+                label_blits.append((battery_text, layout['battery_text']))
                 
                 # Battery level bar
-                battery_ratio = worm.laser_battery / 100.0
-                battery_bar_width = int(bar_width * battery_ratio)
-                
-                # Color based on battery level and cooldown status
-                if worm.laser_cooldown_timer > 0:
-                    battery_color = RED  # Red when in cooldown
-                elif battery_ratio > 0.6:
-                    battery_color = CYAN  # Cyan for high battery (laser color)
-                elif battery_ratio > 0.3:
-                    battery_color = YELLOW
-                else:
-                    battery_color = RED
-                
-                pygame.draw.rect(self.screen, battery_color, (x_start, battery_y + 12, battery_bar_width, bar_height))
+                battery_fill = layout['battery_fill']
+                battery_fill.width = battery_width
+                bar_fills.append((battery_color, battery_fill))
                 
                 # === EQUIPMENT SECTION ===
                 # Dynamites count with icon color
-                dynamite_text = tiny_font.render(f"Dynamites: {worm.dynamite_count}", True, DYNAMITE_INDICATOR_COLOR)
-                self.screen.blit(dynamite_text, (x_start, battery_y + 30))
+                dynamite_text = self._text(20, f"Dynamites: {dynamite_count}", DYNAMITE_INDICATOR_COLOR)
+                label_blits.append((dynamite_text, layout['dynamite_text']))
                 
                 # === COMBAT STATS SECTION ===
                 # Kill/Death stats with distinct formatting
-                kd_text = tiny_font.render(f"K/D: {worm.kills}/{worm.deaths}", True, BLACK)
-                self.screen.blit(kd_text, (x_start, battery_y + 45))
+                kd_text = self._text(20, f"K/D: {kills}/{deaths}", BLACK)
+                label_blits.append((kd_text, layout['kd_text']))
             else:
                 # In unlimited mode, show tools mode and only K/D stats
-                tools_text = tiny_font.render("UNLIMITED TOOLS", True, (0, 255, 100))  # Green text
-                self.screen.blit(tools_text, (x_start, gas_y))
+                tools_text = self._text(20, "UNLIMITED TOOLS", (0, 255, 100))  # Green text
+                label_blits.append((tools_text, layout['gas_text']))
                 
                 # === COMBAT STATS SECTION ===
                 # Kill/Death stats with distinct formatting
-                kd_text = tiny_font.render(f"K/D: {worm.kills}/{worm.deaths}", True, BLACK)
-                self.screen.blit(kd_text, (x_start, gas_y + 20))
+                kd_text = self._text(20, f"K/D: {kills}/{deaths}", BLACK)
+                label_blits.append((kd_text, layout['unlimited_kd_text']))
         
-        # Level indicator at top right
-        level_text = font.render(f"LEVEL {self.level}", True, BLACK)
-        level_rect = level_text.get_rect(right=SCREEN_WIDTH-20, y=15)
-        self.screen.blit(level_text, level_rect)
+        panel.blits(label_blits, doreturn=False)
+        for bar_color, bar_fill in bar_fills:
+            panel.fill(bar_color, bar_fill)
         
         # Battle timer display (if enabled)
-        if self.battle_timer_enabled:
-            minutes = int(self.battle_timer // 60)
-            seconds = int(self.battle_timer % 60)
+        if ui_state[0]:
+            minutes, seconds, timer_color = ui_state[0]
             timer_text = f"{minutes:02d}:{seconds:02d}"
             
-            # Choose color and flash effect for warning
-            if self.battle_timer <= BATTLE_TIMER_WARNING_TIME:
-                timer_color = RED if self.timer_flash_state else WHITE
-            else:
-                timer_color = BLACK
-            
             # Render timer text (positioned lower to avoid cutoff)
-            timer_surface = font.render(timer_text, True, timer_color)
+            timer_surface = self._text(28, timer_text, timer_color)
             timer_rect = timer_surface.get_rect(centerx=SCREEN_WIDTH//2, y=35)
-            self.screen.blit(timer_surface, timer_rect)
+            panel.blit(timer_surface, timer_rect)
             
             # Add "TIME" label above the timer
-            time_label = small_font.render("TIME", True, timer_color)
+            time_label = self._text(24, "TIME", timer_color)
             time_label_rect = time_label.get_rect(centerx=SCREEN_WIDTH//2, y=15)
-            self.screen.blit(time_label, time_label_rect)
+            panel.blit(time_label, time_label_rect)
     
-    def _render_pause_menu(self):
-        """Render the pause menu overlay"""
+    def _build_pause_surfaces(self):
+        """Pre-render the dimming overlay and the quit box for each button selection"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        self._pause_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self._pause_overlay.set_alpha(128)
+        self._pause_overlay.fill((0, 0, 0))
         
-        if self.quit_menu_active:
-            # Quit confirmation box
-            box_width = 400
-            box_height = 200
-            box_x = (SCREEN_WIDTH - box_width) // 2
-            box_y = (SCREEN_HEIGHT - box_height) // 2
-            
-            # Box background
-            pygame.draw.rect(self.screen, (200, 200, 200), (box_x, box_y, box_width, box_height))
-            pygame.draw.rect(self.screen, BLACK, (box_x, box_y, box_width, box_height), 3)
-            
-            # Title
-            font = pygame.font.Font(None, 36)
-            title_text = font.render("Quit to Main Menu?", True, BLACK)
-            title_rect = title_text.get_rect(centerx=SCREEN_WIDTH//2, y=box_y + 30)
-            self.screen.blit(title_text, title_rect)
-            
-            # Buttons
-            button_font = pygame.font.Font(None, 32)
-            button_width = 120
-            button_height = 50
-            button_y = box_y + 120
+        # Box background and border
+        box_width, box_height = self._quit_box_rect.size
+        box_surface = pygame.Surface((box_width, box_height)).convert()
+        box_surface.fill((200, 200, 200))
+        pygame.draw.rect(box_surface, BLACK, (0, 0, box_width, box_height), 3)
+        
+        # Title
+        title_text = self._text(36, "Quit to Main Menu?", BLACK)
+        title_rect = title_text.get_rect(centerx=box_width // 2, y=30)
+        box_surface.blit(title_text, title_rect)
+        
+        # Instructions
+        instruction_text = self._text(24, "Use ← → to select, ENTER to confirm, ESC to cancel", BLACK)
+        instruction_rect = instruction_text.get_rect(centerx=box_width // 2, y=box_height - 25)
+        box_surface.blit(instruction_text, instruction_rect)
+        
+        # Buttons in box coordinates
+        box_x, box_y = self._quit_box_rect.topleft
+        no_button_rect = self._no_button_rect.move(-box_x, -box_y)
+        yes_button_rect = self._yes_button_rect.move(-box_x, -box_y)
+        no_text = self._text(32, "No", BLACK)
+        yes_text = self._text(32, "Yes", BLACK)
+        
+        # One finished box per selection (0 = No, 1 = Yes)
+        self._quit_box_surfaces = []
+        for selection in (0, 1):
+            surface = box_surface.copy()
             
             # No button
-            no_x = box_x + 70
-            no_color = (100, 200, 100) if self.quit_menu_selection == 0 else (150, 150, 150)
-            pygame.draw.rect(self.screen, no_color, (no_x, button_y, button_width, button_height))
-            pygame.draw.rect(self.screen, BLACK, (no_x, button_y, button_width, button_height), 2)
-            no_text = button_font.render("No", True, BLACK)
-            no_rect = no_text.get_rect(center=(no_x + button_width//2, button_y + button_height//2))
-            self.screen.blit(no_text, no_rect)
+            no_color = (100, 200, 100) if selection == 0 else (150, 150, 150)
+            surface.fill(no_color, no_button_rect)
+            pygame.draw.rect(surface, BLACK, no_button_rect, 2)
+            surface.blit(no_text, no_text.get_rect(center=no_button_rect.center))
             
             # Yes button
-            yes_x = box_x + 210
-            yes_color = (200, 100, 100) if self.quit_menu_selection == 1 else (150, 150, 150)
-            pygame.draw.rect(self.screen, yes_color, (yes_x, button_y, button_width, button_height))
-            pygame.draw.rect(self.screen, BLACK, (yes_x, button_y, button_width, button_height), 2)
-            yes_text = button_font.render("Yes", True, BLACK)
-            yes_rect = yes_text.get_rect(center=(yes_x + button_width//2, button_y + button_height//2))
-            self.screen.blit(yes_text, yes_rect)
-            
-            # Instructions
-            instruction_font = pygame.font.Font(None, 24)
-            instruction_text = instruction_font.render("Use ← → to select, ENTER to confirm, ESC to cancel", True, BLACK)
-            instruction_rect = instruction_text.get_rect(centerx=SCREEN_WIDTH//2, y=box_y + box_height - 25)
-            self.screen.blit(instruction_text, instruction_rect)
+            yes_color = (200, 100, 100) if selection == 1 else (150, 150, 150)
+            surface.fill(yes_color, yes_button_rect)
+            pygame.draw.rect(surface, BLACK, yes_button_rect, 2)
+            surface.blit(yes_text, yes_text.get_rect(center=yes_button_rect.center))
+            self._quit_box_surfaces.append(surface)
+    
+    def _render_pause_menu(self):
+        """Render the pause menu overlay"""
+        # Semi-transparent overlay
+        self.screen.blit(self._pause_overlay, (0, 0))
+        
+        if self.quit_menu_active:
+            # Quit confirmation box, pre-rendered with the current button selected
+            self.screen.blit(self._quit_box_surfaces[self.quit_menu_selection], self._quit_box_rect)
         else:
             # Simple pause message
-            font = pygame.font.Font(None, 72)
-            pause_text = font.render("PAUSED", True, WHITE)
+            pause_text = self._text(72, "PAUSED", WHITE)
             pause_rect = pause_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
             self.screen.blit(pause_text, pause_rect)
             
-            instruction_font = pygame.font.Font(None, 36)
-            instruction_text = instruction_font.render("Press ESC to resume", True, WHITE)
+            instruction_text = self._text(36, "Press ESC to resume", WHITE)
             instruction_rect = instruction_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 60))
             self.screen.blit(instruction_text, instruction_rect)
     
@@ -869,40 +1149,49 @@ class Game:
         """Render FPS counter in bottom right corner"""
         if self.fps_values:
             # Calculate average FPS
-            avg_fps = sum(self.fps_values) / len(self.fps_values)
+            avg_fps = self._fps_sum / len(self.fps_values)
             
-            # Choose color based on FPS
-            if avg_fps >= 50:
-                fps_color = GREEN
-            elif avg_fps >= 30:
-                fps_color = YELLOW
+            # Refresh the label a few times a second, and only re-render it when the value changed
+            if self._fps_label is None or self.fps_update_timer >= _FPS_LABEL_INTERVAL:
+                self.fps_update_timer = 0
+                fps_value = int(avg_fps * 10)
             else:
-                fps_color = RED
-            
-            # Render FPS text
-            fps_font = pygame.font.Font(None, 28)
-            fps_text = fps_font.render(f"FPS: {avg_fps:.1f}", True, fps_color)
-            fps_rect = fps_text.get_rect(bottomright=(SCREEN_WIDTH - 10, SCREEN_HEIGHT - 10))
-            
-            # Add background for better readability
-            bg_rect = fps_rect.copy()
-            bg_rect.inflate_ip(10, 4)
-            pygame.draw.rect(self.screen, (0, 0, 0, 128), bg_rect)
+                fps_value = self._fps_label_value
+            if fps_value != self._fps_label_value:
+                # Choose color based on FPS
+                if avg_fps >= 50:
+                    fps_color = GREEN
+                elif avg_fps >= 30:
+                    fps_color = YELLOW
+                else:
+                    fps_color = RED
+                
+                # Render FPS text (kept out of the shared text cache, it changes too often)
+                fps_text = self._fonts[28].render(f"FPS: {avg_fps:.1f}", True, fps_color)
+                fps_rect = fps_text.get_rect(bottomright=(SCREEN_WIDTH - 10, SCREEN_HEIGHT - 10))
+                
+                # Add background for better readability
+                bg_rect = fps_rect.inflate(10, 4)
+                self._fps_label = (fps_text, fps_rect, bg_rect)
+                self._fps_label_value = fps_value
             
+            fps_text, fps_rect, bg_rect = self._fps_label
+            self.screen.fill((0, 0, 0, 128), bg_rect)
             self.screen.blit(fps_text, fps_rect)
     
     def get_game_stats(self):
         """
         Collect and return game statistics for all players
         """
+        # Worm.__init__ sets every field read here
         stats = {}
         for i, worm in enumerate(self.worms):
             stats[i] = {
-                'name': getattr(worm, 'name', f'Player {i+1}'),
-                'color': getattr(worm, 'color', (255, 255, 255)),
+                'name': worm.name,
+                'color': worm.color,
                 'kills': worm.kills,
                 'deaths': worm.deaths,
-                'fall_deaths': getattr(worm, 'fall_deaths', 0),
-                'self_deaths': getattr(worm, 'self_deaths', 0)
+                'fall_deaths': worm.fall_deaths,
+                'self_deaths': worm.self_deaths
             }
         return stats
\ No newline at end of file
@@ -1,4 +1,5 @@
 import json
+import textwrap
 import pygame
 from typing import Dict, Any, Optional
 
@@ -11,22 +12,29 @@ class GameInfoManager:
     def __init__(self):
         self.info_data: Dict[str, Any] = {}
         self.current_mode: str = "battle"  # Default mode
+        self._tool_damage_values: Dict[str, int] = {}  # Parsed once per load
+        self._format_cache: Dict[tuple, list] = {}  # Display lines by (section, max_width, mode)
         self.load_info()
     
     def load_info(self) -> bool:
         """Load game information from JSON file."""
         try:
-            with open("game_info.json", "r", encoding="utf-8") as file:
-                self.info_data = json.load(file)
-            return True
+            # Parse the raw bytes (json detects the UTF-8 encoding itself)
+            with open("game_info.json", "rb") as file:
+                self.info_data = json.loads(file.read())
+            loaded = True
         except FileNotFoundError:
             print("Warning: game_info.json not found. Using fallback data.")
             self._create_fallback_data()
-            return False
+            loaded = False
         except json.JSONDecodeError as e:
             print(f"Error parsing game_info.json: {e}")
             self._create_fallback_data()
-            return False
+            loaded = False
+        
+        self._tool_damage_values = self._parse_tool_damage_values()
+        self._format_cache.clear()
+        return loaded
     
     def _create_fallback_data(self):
         """Create minimal fallback data if JSON file is unavailable."""
@@ -76,10 +84,9 @@ class GameInfoManager:
             general_tips = tips_data.get("general", [])
             return mode_tips + general_tips
     
-    def get_tool_damage_values(self) -> Dict[str, int]:
-        """Get quick reference of tool damage values."""
-        controls = self.get_controls_info()
-        tools = controls.get("tools", {})
+    def _parse_tool_damage_values(self) -> Dict[str, int]:
+        """Extract the damage value from each tool's damage description."""
+        tools = self.get_controls_info().get("tools", {})
         
         damage_values = {}
         for tool_name, tool_info in tools.items():
@@ -97,8 +104,18 @@ class GameInfoManager:
         
         return damage_values
     
+    def get_tool_damage_values(self) -> Dict[str, int]:
+        """Get quick reference of tool damage values."""
+        return self._tool_damage_values
+    
     def format_info_for_display(self, section: str, max_width: int = 80) -> list:
         """Format information section for display with word wrapping."""
+        # Reuse the lines while the data and mode are unchanged
+        cache_key = (section, max_width, self.current_mode)
+        cached = self._format_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         lines = []
         
         if section == "mode":
@@ -151,25 +168,17 @@ class GameInfoManager:
                 lines.append(f"{i}. {tip}")
             lines.append("")
         
-        # Simple word wrapping
+        # Word wrapping (lines that fit, blank ones included, are kept as they are)
         wrapped_lines = []
         for line in lines:
             if len(line) <= max_width:
                 wrapped_lines.append(line)
             else:
-                # Basic word wrapping
-                words = line.split()
-                current_line = ""
-                for word in words:
-                    if len(current_line + " " + word) <= max_width:
-                        current_line += (" " if current_line else "") + word
-                    else:
-                        if current_line:
-                            wrapped_lines.append(current_line)
-                        current_line = word
-                if current_line:
-                    wrapped_lines.append(current_line)
+                # Greedy fill of the line's words (single-spaced, indent dropped); overlong words stay whole
+                wrapped_lines.extend(textwrap.wrap(" ".join(line.split()), max_width,
+                                                   break_long_words=False, break_on_hyphens=False))
         
+        self._format_cache[cache_key] = wrapped_lines
         return wrapped_lines
 
 # Global instance for easy access
@@ -5,7 +5,7 @@ Handles main menu, player configuration, and game setup
 
 import pygame
 import time
-from src.config import *
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, WHITE, GREEN, RED, YELLOW, GRAY
 from src.game_info_manager import game_info
 
 class WormConfig:
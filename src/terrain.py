@@ -6,7 +6,11 @@ Handles the destructible terrain/map that worms can dig through
 import pygame
 import random
 import math
-from src.config import *
+import numpy as np
+from src.config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, BROWN, GRAY, TILE_SIZE, UI_HEIGHT, DRILL_WIDTH,
+    DRILL_DEPTH, TORCH_CONE_ANGLE,
+)
 
 class TerrainType:
     EMPTY = 0
@@ -261,6 +265,51 @@ class Terrain:
         """Check if a position is solid (blocks movement)"""
         return self.get_tile(x, y) != TerrainType.EMPTY
     
+    def surface_y(self, x, y, min_y):
+        """Climb from (x, y) a tile at a time to the first open spot, never above min_y"""
+        tile_x = int(x // TILE_SIZE)
+        tile_y = int((y - UI_HEIGHT) // TILE_SIZE)
+        inside_x = 0 <= tile_x < self.width
+        
+        # Walk the tile column directly (same boundary rules as get_tile)
+        while y > min_y and tile_y < self.height:
+            if inside_x and tile_y >= 0 and self.tiles[tile_y][tile_x] == TerrainType.EMPTY:
+                break
+            y -= TILE_SIZE
+            tile_y -= 1
+        return y
+    
+    def ground_y(self, x, y, max_y, step):
+        """Where a step-pixel drop from (x, y) first hits solid ground, stopping at max_y"""
+        tile_x = int(x // TILE_SIZE)
+        tile_y = int((y - UI_HEIGHT) // TILE_SIZE)
+        inside_x = 0 <= tile_x < self.width
+        
+        # Walk the tile column down to the first solid tile (same boundary rules as get_tile)
+        stop_y = max_y
+        while tile_y < self.height:
+            if not inside_x or tile_y < 0 or self.tiles[tile_y][tile_x] != TerrainType.EMPTY:
+                stop_y = min(stop_y, UI_HEIGHT + tile_y * TILE_SIZE)
+                break
+            tile_y += 1
+        
+        # Land on the step grid, as a drop of step <= TILE_SIZE pixels would
+        if stop_y <= y:
+            return y
+        return y + math.ceil((stop_y - y) / step) * step
+    
+    def is_solid_batch(self, xs, ys):
+        """Vectorized is_solid for NumPy arrays of pixel coordinates"""
+        tile_x = (xs // TILE_SIZE).astype(int)
+        tile_y = ((ys - UI_HEIGHT) // TILE_SIZE).astype(int)
+        
+        # Same boundary rules as get_tile: open below the map, solid on other edges
+        solid = tile_y < self.height
+        inside = solid & (tile_x >= 0) & (tile_x < self.width) & (tile_y >= 0)
+        for i in np.flatnonzero(inside):
+            solid[i] = self.tiles[tile_y[i]][tile_x[i]] != TerrainType.EMPTY
+        return solid
+    
     def _rebuild_terrain_surface(self):
         """Rebuild the pre-rendered terrain surface for optimal performance"""
         # Create surface to hold the entire terrain
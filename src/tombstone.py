@@ -5,7 +5,7 @@ Handles tombstones that drop when worms die, containing lootable resources
 
 import pygame
 import math
-from src.config import *
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, WORM_RADIUS, MAX_GAS
 
 class Tombstone:
     def __init__(self, x, y, gas_amount, dynamite_amount, deceased_worm_name="Unknown"):
@@ -23,6 +23,7 @@ class Tombstone:
         
         # Interaction radius
         self.interaction_radius = WORM_RADIUS + 10
+        self._interaction_radius_sq = self.interaction_radius * self.interaction_radius
         
     def update(self, dt):
         """Update tombstone animations"""
@@ -43,11 +44,12 @@ class Tombstone:
         if self.is_looted:
             return False
             
-        # Calculate distance to worm
+        # Compare squared distance to worm (no square root needed)
         worm_x, worm_y = worm.body_segments[0]
-        distance = math.sqrt((worm_x - self.x)**2 + (worm_y - self.y)**2)
+        dx = worm_x - self.x
+        dy = worm_y - self.y
         
-        return distance <= self.interaction_radius
+        return dx * dx + dy * dy <= self._interaction_radius_sq
         
     def loot(self, worm):
         """Give resources to worm and mark tombstone as looted"""
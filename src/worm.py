@@ -7,7 +7,17 @@ import pygame
 import math
 import random
 import time
-from src.config import *
+from src.config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, WHITE, BLUE, RED, GRAY, WORM_COLOR,
+    DRILL_INDICATOR_COLOR, TORCH_INDICATOR_COLOR, LASER_INDICATOR_COLOR,
+    DYNAMITE_INDICATOR_COLOR, TILE_SIZE, UI_HEIGHT, MAP_HEIGHT, WORM_SPEED, WORM_RADIUS,
+    GRAVITY, JUMP_VELOCITY, TERMINAL_VELOCITY, GROUND_FRICTION, MAX_SLOPE_ANGLE,
+    FALL_DAMAGE_START_HEIGHT, FALL_DAMAGE_VELOCITY_THRESHOLD, FALL_DAMAGE_MULTIPLIER,
+    DRILL_WIDTH, DRILL_DEPTH, DYNAMITE_RADIUS, DYNAMITE_COUNT_START, TORCH_RADIUS,
+    TORCH_RANGE, TORCH_GAS_COST, TORCH_CONE_ANGLE, LASER_WIDTH, RESPAWN_TIME,
+    SPAWN_PROTECTION_TIME, TOMBSTONE_RESOURCE_PERCENTAGE, POWER_CHARGE_RATE, MAX_POWER,
+    STARTING_GAS, MAX_GAS, GAS_BOTTLE_AMOUNT, GAS_REFILL_AMOUNT,
+)
 from src.dynamite import ThrownDynamite
 
 class Worm:
@@ -36,6 +46,7 @@ class Worm:
         # Dynamite system
         self.dynamite_count = DYNAMITE_COUNT_START
         self.thrown_dynamites = []  # List of active thrown dynamites
+        self.dynamite_pool = None  # Shared physics pool (will be set by game)
         
 
         # Power charging system
@@ -793,7 +804,7 @@ class Worm:
             return
             
         # Create thrown dynamite
-        dynamite = ThrownDynamite(self.x, self.y, target_x, target_y, power)
+        dynamite = ThrownDynamite(self.x, self.y, target_x, target_y, power, self.dynamite_pool)
         self.thrown_dynamites.append(dynamite)
         
         # Consume dynamite only in standard mode
@@ -1017,13 +1028,6 @@ class Worm:
         if not self.is_respawning:
             self._update_tool_direction(dt)
         
-        # Update thrown dynamites
-        for dynamite in self.thrown_dynamites[:]:  # Copy list to avoid modification issues
-            if dynamite.update(dt, terrain):
-                # Dynamite exploded - dig terrain but don't remove yet (damage check will handle removal)
-                dyn_x, dyn_y = dynamite.get_position()
-                terrain.dig(dyn_x, dyn_y, DYNAMITE_RADIUS, "dynamite")
-                
         # Update torch fire effects
         if self.torch_fire_timer > 0:
             self.torch_fire_timer -= dt
@@ -1330,9 +1334,11 @@ class Worm:
                 if other_radius <= 2:
                     continue
                     
-                # Check distance between segment centers
-                distance = math.sqrt((my_x - other_x)**2 + (my_y - other_y)**2)
-                if distance < (my_radius + other_radius):
+                # Check squared distance between segment centers
+                dx = my_x - other_x
+                dy = my_y - other_y
+                touch_distance = my_radius + other_radius
+                if dx * dx + dy * dy < touch_distance * touch_distance:
                     return True
         return False
         